@@ -0,0 +1,44 @@
+import argparse
+import sys
+from os.path import dirname, join
+from .runner import run, compare, format_table, load_baseline, save_baseline
+from .scenarios import SCENARIOS
+
+
+BASELINE_PATH = join(dirname(__file__), 'baseline.json')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks InputHandler bind hot paths')
+    parser.add_argument('scenarios', nargs='*', help='scenarios to run, all by default')
+    parser.add_argument('--duration', type=float, default=0.5, help='seconds spent on each scenario')
+    parser.add_argument('--rounds', type=int, default=3, help='rounds per scenario, the median one is kept')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2, help='throughput drop reported as a regression')
+    parser.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    arguments = parser.parse_args()
+
+    results = run(SCENARIOS, arguments.duration, selected=arguments.scenarios, rounds=arguments.rounds)
+
+    if arguments.save:
+        save_baseline(arguments.baseline, results)
+        print(format_table(results))
+        return 0
+
+    try:
+        baseline = load_baseline(arguments.baseline)
+    except FileNotFoundError:
+        baseline = {}
+
+    print(format_table(results, baseline))
+    regressions = compare(results, baseline, arguments.threshold)
+
+    if regressions:
+        print('Regressions: {}'.format(', '.join(regressions)))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
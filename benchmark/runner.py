@@ -0,0 +1,154 @@
+import asyncio
+import json
+import tracemalloc
+from time import perf_counter
+
+
+def percentile(timings, fraction):
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(timings, peak_traced_bytes):
+    total = sum(timings)
+
+    return {
+        'ops': round(len(timings) / total, 1),
+        'p50_us': round(percentile(timings, 0.5) * 1e6, 1),
+        'p95_us': round(percentile(timings, 0.95) * 1e6, 1),
+        'p99_us': round(percentile(timings, 0.99) * 1e6, 1),
+        'peak_traced_bytes': peak_traced_bytes,
+    }
+
+
+def measure_peak_traced_bytes(bind, samples=5):
+    '''
+    Returns the smallest tracemalloc peak, in bytes above the memory in use
+    before the bind, over samples binds. This is memory held at once during a
+    bind, not a count of allocations.
+    '''
+    tracemalloc.start()
+
+    try:
+        peaks = []
+
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            bind()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+
+    return min(peaks)
+
+
+def run_sync(handler, payload, options, duration, min_iterations):
+    def bind():
+        handler.bind_sync(payload, **options)
+
+    for _ in range(min_iterations):
+        bind()
+
+    timings = []
+    deadline = perf_counter() + duration
+
+    while len(timings) < min_iterations or perf_counter() < deadline:
+        start = perf_counter()
+        bind()
+        timings.append(perf_counter() - start)
+
+    return summarize(timings, measure_peak_traced_bytes(bind))
+
+
+def run_async(handler, payload, options, duration, min_iterations):
+    async def measure():
+        for _ in range(min_iterations):
+            await handler.bind(payload, **options)
+
+        timings = []
+        deadline = perf_counter() + duration
+
+        while len(timings) < min_iterations or perf_counter() < deadline:
+            start = perf_counter()
+            await handler.bind(payload, **options)
+            timings.append(perf_counter() - start)
+
+        return timings
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        timings = loop.run_until_complete(measure())
+        peak_traced_bytes = measure_peak_traced_bytes(lambda: loop.run_until_complete(handler.bind(payload, **options)))
+    finally:
+        loop.close()
+
+    return summarize(timings, peak_traced_bytes)
+
+
+def get_median(rounds):
+    return sorted(rounds, key=lambda result: result['ops'])[len(rounds) // 2]
+
+
+def run(scenarios, duration=0.5, min_iterations=20, selected=None, rounds=1):
+    '''
+    Runs each scenario rounds times, interleaved, and keeps the round with the
+    median throughput, so a baseline is not taken from a single lucky or slow
+    round.
+    '''
+    measured = {}
+
+    for _ in range(rounds):
+        for name, handler_class, payload, options in scenarios:
+            if selected and name not in selected:
+                continue
+
+            handler = handler_class()
+            measured.setdefault(name + ':async', []).append(run_async(handler, payload, options, duration, min_iterations))
+            measured.setdefault(name + ':sync', []).append(run_sync(handler, payload, options, duration, min_iterations))
+
+    return {name: get_median(results) for name, results in measured.items()}
+
+
+def compare(results, baseline, threshold):
+    '''
+    Returns the names of the results whose throughput dropped by more than
+    threshold (a fraction) compared to the baseline.
+    '''
+    regressions = []
+
+    for name, result in results.items():
+        if name in baseline and result['ops'] < baseline[name]['ops'] * (1 - threshold):
+            regressions.append(name)
+
+    return regressions
+
+
+def format_table(results, baseline=None):
+    lines = ['{:<22} {:>12} {:>10} {:>10} {:>10} {:>18} {:>8}'.format(
+        'scenario', 'ops/sec', 'p50 us', 'p95 us', 'p99 us', 'peak traced bytes', 'change'
+    )]
+
+    for name, result in results.items():
+        change = ''
+
+        if baseline and name in baseline:
+            change = '{:+.0%}'.format(result['ops'] / baseline[name]['ops'] - 1)
+
+        lines.append('{:<22} {:>12,.1f} {:>10} {:>10} {:>10} {:>18,} {:>8}'.format(
+            name, result['ops'], result['p50_us'], result['p95_us'], result['p99_us'], result['peak_traced_bytes'], change
+        ))
+
+    return '\n'.join(lines)
+
+
+def load_baseline(path):
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path, results):
+    with open(path, 'w') as baseline_file:
+        json.dump(results, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write('\n')
@@ -0,0 +1,91 @@
+from fractal_input import InputHandler, ListNode, DatetimeNode
+
+
+class User(object):
+    name = None
+    email = None
+    age = None
+    address = None
+
+
+class Address(object):
+    street = None
+    location = None
+
+
+class FlatHandler(InputHandler):
+    def define(self):
+        self.add('name', 'string')
+        self.add('email', 'string')
+        self.add('age', 'integer')
+        self.add('score', 'float')
+        self.add('is_active', 'boolean')
+        self.add('nickname', 'string', {'required': False})
+        self.add('country', 'string', {'required': False})
+        self.add('visits', 'integer', {'required': False})
+
+
+class NestedHandler(InputHandler):
+    def define(self):
+        node = self
+        for depth in range(6):
+            node = node.add('level{}'.format(depth), User if depth % 2 else Address)
+            node.add('name', 'string')
+            node.add('value', 'integer', {'required': False})
+
+
+class IntegerListHandler(InputHandler):
+    def define(self):
+        self.add('values', ListNode('integer'))
+
+
+class DatetimeHandler(InputHandler):
+    def define(self):
+        events = self.add('events', ListNode('dict'))
+        events.add('created', DatetimeNode('%Y-%m-%dT%H:%M:%S'))
+        events.add('updated', DatetimeNode('%d/%m/%Y %H:%M'))
+
+
+class EmailHandler(InputHandler):
+    def define(self):
+        self.add('emails', ListNode('email'))
+
+
+class FailingHandler(InputHandler):
+    def define(self):
+        users = self.add('users', ListNode(User))
+        users.add('name', 'string')
+        users.add('email', 'email')
+        users.add('age', 'integer')
+
+
+def nested_payload(depth=6):
+    payload = {}
+    node = payload
+
+    for index in range(depth):
+        node['level{}'.format(index)] = {'name': 'level', 'value': index}
+        node = node['level{}'.format(index)]
+
+    return payload
+
+
+'''
+Scenario name, handler class, payload and bind options.
+'''
+SCENARIOS = [
+    ('flat', FlatHandler, {
+        'name': 'Rick', 'email': 'rick@example.com', 'age': '70', 'score': 9.5, 'is_active': 1, 'nickname': 'pickle',
+    }, {}),
+    ('nested', NestedHandler, nested_payload(), {}),
+    ('integer_list', IntegerListHandler, {'values': list(range(10000))}, {}),
+    ('datetime_list', DatetimeHandler, {
+        'events': [{'created': '2020-01-{:02d}T10:11:12'.format(day % 28 + 1), 'updated': '01/02/2020 10:11'} for day in range(500)],
+    }, {}),
+    ('email_list', EmailHandler, {
+        'emails': ['User.{}@Example.com'.format(index) for index in range(500)],
+    }, {}),
+    ('failing', FailingHandler, {
+        'users': [{'name': 'a', 'email': 'invalid', 'age': 1}] * 50 + [{}] * 50,
+    }, {'collect_errors': True}),
+]
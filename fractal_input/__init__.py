@@ -1,3 +1,9 @@
 from .version import __version__ # noqa
 from .input_handler import InputHandler # noqa
-from .node import Node, ObjectNode, ListNode, DatetimeNode # noqa
+from .node import Node, ObjectNode, ListNode, DatetimeNode, UnionNode # noqa
+from .schema import Schema # noqa
+from .cache import TransformCache # noqa
+from .profiler import NodeProfiler # noqa
+from .store import SchemaStore # noqa
+from .result import BindResult # noqa
+from .budget import Budget # noqa
@@ -0,0 +1,90 @@
+from .constraint import ConstraintException
+
+
+UNLIMITED = float('inf')
+
+
+class BudgetExceededException(ConstraintException):
+    pass
+
+
+class Budget(object):
+    '''
+    Limits the size of the input accepted by a bind. The input is measured
+    before it is validated, and measuring stops at the first exceeded limit, so
+    hostile payloads are rejected in time bounded by the limits rather than by
+    the payload.
+    '''
+
+    def __init__(self, max_depth=None, max_items=None, max_string_length=None, max_values=None):
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_string_length = max_string_length
+        self.max_values = max_values
+
+    def to_dict(self):
+        return {
+            'max_depth': self.max_depth,
+            'max_items': self.max_items,
+            'max_string_length': self.max_string_length,
+            'max_values': self.max_values,
+        }
+
+    def check(self, value, depth=1):
+        '''
+        Measures value, nested depth - 1 levels deep in the input, and raises
+        BudgetExceededException at the first exceeded limit.
+        '''
+        max_depth = UNLIMITED if self.max_depth is None else self.max_depth
+        max_items = UNLIMITED if self.max_items is None else self.max_items
+        max_string_length = UNLIMITED if self.max_string_length is None else self.max_string_length
+        max_values = UNLIMITED if self.max_values is None else self.max_values
+
+        if isinstance(value, str) and len(value) > max_string_length:
+            raise self.create_exception('String is longer than {} characters', max_string_length, None, None)
+
+        values = 1
+        stack = [(value, depth, None, None)]
+
+        while stack:
+            entry = stack.pop()
+            container, depth, parent, key = entry
+
+            if isinstance(container, dict):
+                items = container.items()
+            elif isinstance(container, (list, tuple)):
+                if len(container) > max_items:
+                    raise self.create_exception('List has more than {} items', max_items, parent, key)
+
+                items = enumerate(container)
+            else:
+                continue
+
+            if depth > max_depth:
+                raise self.create_exception('Input is nested deeper than {} levels', max_depth, parent, key)
+
+            values += len(container)
+
+            if values > max_values:
+                raise self.create_exception('Input has more than {} values', max_values, parent, key)
+
+            for item_key, item in items:
+                if isinstance(item, str):
+                    if len(item) > max_string_length:
+                        raise self.create_exception('String is longer than {} characters', max_string_length, entry, item_key)
+                elif isinstance(item, (dict, list, tuple)):
+                    stack.append((item, depth + 1, entry, item_key))
+
+                if isinstance(item_key, str) and len(item_key) > max_string_length:
+                    raise self.create_exception('Key is longer than {} characters', max_string_length, entry, None)
+
+    def create_exception(self, message, limit, parent, key):
+        path = [] if key is None else [key]
+
+        while parent is not None:
+            container, depth, parent, parent_key = parent
+
+            if parent_key is not None:
+                path.insert(0, parent_key)
+
+        return BudgetExceededException(message.format(limit), path)
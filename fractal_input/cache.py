@@ -0,0 +1,139 @@
+from asyncio import CancelledError, get_running_loop, shield
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from .constraint import ConstraintException
+
+
+UNHASHABLE = object()
+
+
+class TransformCache(object):
+    '''
+    LRU cache of transform results, shared by the binds of every thread. Lookups
+    in flight are only coalesced within the event loop that started them.
+    '''
+
+    def __init__(self, maxsize=1024, ttl=None, key=None, clock=monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.key = key
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def get_key(self, value):
+        key = self.key(value) if self.key else (type(value), value)
+
+        try:
+            hash(key)
+        except TypeError:
+            return UNHASHABLE
+
+        return key
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+
+            if expires_at is not None and expires_at <= self.clock():
+                del self.entries[key]
+                return False, None
+
+            self.entries.move_to_end(key)
+            return True, value
+
+    def store(self, key, value):
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+
+        with self.lock:
+            self.entries[key] = (expires_at, value)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    async def get(self, value, compute):
+        key = self.get_key(value)
+
+        if key is UNHASHABLE:
+            return await compute(value)
+
+        found, result = self.lookup(key)
+
+        if found:
+            self.hits += 1
+            return result
+
+        loop = get_running_loop()
+        pending_key = (loop, key)
+        future = self.pending.get(pending_key)
+
+        if future is not None:
+            self.hits += 1
+
+            try:
+                return await shield(future)
+            except ConstraintException as e:
+                # Every waiter gets its own copy, since parents prepend their path to it
+                raise e.copy()
+
+        self.misses += 1
+        future = loop.create_future()
+        self.pending[pending_key] = future
+
+        try:
+            result = await compute(value)
+        except CancelledError:
+            future.cancel()
+            raise
+        except ConstraintException as e:
+            future.set_exception(e.copy())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            self.store(key, result)
+            future.set_result(result)
+        finally:
+            del self.pending[pending_key]
+
+        return result
+
+    def get_sync(self, value, compute):
+        key = self.get_key(value)
+
+        if key is UNHASHABLE:
+            return compute(value)
+
+        found, result = self.lookup(key)
+
+        if found:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = compute(value)
+        self.store(key, result)
+        return result
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries)}
@@ -1,9 +1,42 @@
+import re
+from abc import ABCMeta, abstractmethod
+
 
 class ConstraintException(Exception):
-    def __init__(self, message):
-        super(ConstraintException, self).__init__()
+    def __init__(self, message, path=None):
+        super(ConstraintException, self).__init__(message)
 
         self.message = message
+        self.path = path if path is not None else []
+
+    def prepend_path(self, key):
+        self.path.insert(0, key)
+
+    def copy(self):
+        exception = self.__class__.__new__(self.__class__, *self.args)
+        exception.__dict__.update(self.__dict__)
+        exception.path = list(self.path)
+        return exception
+
+    def get_pointer(self):
+        return ''.join('/' + str(key).replace('~', '~0').replace('/', '~1') for key in self.path)
+
+
+class ConstraintErrors(ConstraintException):
+    def __init__(self, errors, is_limited=False):
+        super(ConstraintErrors, self).__init__(','.join(error.message for error in errors))
+
+        self.errors = errors
+        self.is_limited = is_limited
+
+    def prepend_path(self, key):
+        for error in self.errors:
+            error.prepend_path(key)
+
+    def copy(self):
+        exception = super(ConstraintErrors, self).copy()
+        exception.errors = [error.copy() for error in self.errors]
+        return exception
 
 
 class Constraint(object):
@@ -17,3 +50,211 @@ class RequiredConstraint(Constraint):
 
     def validate(self, value):
         return value is not None
+
+
+class DeclarativeConstraint(Constraint, metaclass=ABCMeta):
+    '''
+    Base class for the built-in constraints. Values are checked by a predicate
+    built once, when the constraint is created, and whole lists of scalars can be
+    checked at once with the predicate returned by compile_many(). None is always
+    accepted, use the required option to reject it.
+    '''
+
+    def __init__(self, message):
+        self.message = message
+        self.check = self.compile()
+
+    def validate(self, value):
+        return self.check(value)
+
+    @abstractmethod
+    def compile(self):
+        '''
+        Returns the predicate checking a single value.
+        '''
+
+    def compile_many(self):
+        check = self.check
+
+        def check_many(values):
+            return all(map(check, values))
+
+        return check_many
+
+
+class RangeConstraint(DeclarativeConstraint):
+    def __init__(self, min=None, max=None, message=None):
+        if min is None and max is None:
+            raise ValueError('At least one of min and max is required')
+
+        self.min = min
+        self.max = max
+
+        if message is None and min is not None and max is not None:
+            message = r'{field} must be between ' + '{} and {}'.format(min, max)
+        elif message is None and min is not None:
+            message = r'{field} must be greater than or equal to ' + str(min)
+        elif message is None:
+            message = r'{field} must be less than or equal to ' + str(max)
+
+        super(RangeConstraint, self).__init__(message)
+
+    def compile(self):
+        minimum = self.min
+        maximum = self.max
+
+        def check(value):
+            if value is None:
+                return True
+
+            try:
+                return (minimum is None or value >= minimum) and (maximum is None or value <= maximum)
+            except TypeError:
+                return False
+
+        return check
+
+    def compile_many(self):
+        minimum = self.min
+        maximum = self.max
+
+        # Every value is compared: min() and max() depend on the order of the
+        # values when one of them is NaN
+        def check_many(values):
+            try:
+                if minimum is None:
+                    return all(value <= maximum for value in values)
+
+                if maximum is None:
+                    return all(value >= minimum for value in values)
+
+                return all(minimum <= value <= maximum for value in values)
+            except TypeError:
+                return False
+
+        return check_many
+
+
+class LengthConstraint(RangeConstraint):
+    def __init__(self, min=None, max=None, message=None):
+        if message is None and min is not None and max is not None:
+            message = r'{field} length must be between ' + '{} and {}'.format(min, max)
+        elif message is None and min is not None:
+            message = r'{field} length must be at least ' + str(min)
+        elif message is None:
+            message = r'{field} length must be at most ' + str(max)
+
+        super(LengthConstraint, self).__init__(min, max, message)
+
+    def compile(self):
+        check_range = super(LengthConstraint, self).compile()
+
+        def check(value):
+            if value is None:
+                return True
+
+            try:
+                return check_range(len(value))
+            except TypeError:
+                return False
+
+        return check
+
+    def compile_many(self):
+        check_range = super(LengthConstraint, self).compile_many()
+
+        def check_many(values):
+            try:
+                return check_range(list(map(len, values)))
+            except TypeError:
+                return False
+
+        return check_many
+
+
+class RegexConstraint(DeclarativeConstraint):
+    '''
+    Accepts strings entirely matched by pattern.
+    '''
+
+    def __init__(self, pattern, flags=0, message=None):
+        self.regex = re.compile(pattern, flags)
+
+        if message is None:
+            message = r'{field} has an invalid format'
+
+        super(RegexConstraint, self).__init__(message)
+
+    def compile(self):
+        fullmatch = self.regex.fullmatch
+
+        def check(value):
+            return value is None or (isinstance(value, str) and fullmatch(value) is not None)
+
+        return check
+
+
+class EnumConstraint(DeclarativeConstraint):
+    def __init__(self, values, message=None):
+        self.values = frozenset(values)
+
+        if message is None:
+            message = r'{field} must be one of ' + ', '.join(sorted(map(str, self.values)))
+
+        super(EnumConstraint, self).__init__(message)
+
+    def compile(self):
+        values = self.values
+
+        def check(value):
+            try:
+                return value is None or value in values
+            except TypeError:
+                return False
+
+        return check
+
+    def compile_many(self):
+        issuperset = self.values.issuperset
+
+        def check_many(values):
+            try:
+                return issuperset(values)
+            except TypeError:
+                return False
+
+        return check_many
+
+
+class UniqueConstraint(DeclarativeConstraint):
+    '''
+    Rejects lists containing the same value more than once.
+    '''
+
+    def __init__(self, message=None):
+        if message is None:
+            message = r'{field} must not contain duplicate values'
+
+        super(UniqueConstraint, self).__init__(message)
+
+    def compile(self):
+        def check(values):
+            if values is None:
+                return True
+
+            try:
+                return len(set(values)) == len(values)
+            except TypeError:
+                pass
+
+            seen = []
+
+            for value in values:
+                if value in seen:
+                    return False
+
+                seen.append(value)
+
+            return True
+
+        return check
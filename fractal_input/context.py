@@ -0,0 +1,55 @@
+from asyncio import Semaphore
+from contextvars import ContextVar
+from .constraint import ConstraintErrors
+
+
+bind_context = ContextVar('bind_context', default=None)
+
+
+class BindContext(object):
+    def __init__(self, collect_errors=False, max_errors=None, concurrency=None, trusted=False, profiler=None, lazy=False, budget=None):
+        self.collect_errors = collect_errors
+        self.max_errors = max_errors
+        self.error_count = 0
+        self.concurrency = concurrency
+        self.semaphore = None
+        self.trusted = trusted
+        self.profiler = profiler
+        self.lazy = lazy
+        self.budget = budget
+
+    def get_semaphore(self):
+        if self.concurrency and self.semaphore is None:
+            self.semaphore = Semaphore(self.concurrency)
+
+        return self.semaphore
+
+
+def collect_error(exception, errors):
+    '''
+    Called by container nodes when a child fails. Re-raises the exception unless
+    the current bind collects errors, otherwise adds it to the container errors.
+    '''
+    context = bind_context.get()
+
+    if context is None or not context.collect_errors:
+        raise exception
+
+    if errors is None:
+        errors = []
+
+    if isinstance(exception, ConstraintErrors):
+        errors.extend(exception.errors)
+
+        if exception.is_limited:
+            raise ConstraintErrors(errors, True)
+
+        return errors
+
+    errors.append(exception)
+    context.error_count += 1
+
+    if context.max_errors is not None and context.error_count >= context.max_errors:
+        raise ConstraintErrors(errors, True)
+
+    return errors
@@ -0,0 +1,129 @@
+import re
+from datetime import datetime
+
+
+'''
+Directive patterns taken from the standard library _strptime module, restricted
+to ASCII digits. Values that do not match are handed to datetime.strptime, which
+stays the reference implementation and produces the error messages.
+'''
+DIRECTIVES = {
+    'd': r'(?P<d>3[0-1]|[1-2][0-9]|0[1-9]|[1-9]| [1-9])',
+    'f': r'(?P<f>[0-9]{1,6})',
+    'H': r'(?P<H>2[0-3]|[0-1][0-9]|[0-9])',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'M': r'(?P<M>[0-5][0-9]|[0-9])',
+    'S': r'(?P<S>6[0-1]|[0-5][0-9]|[0-9])',
+    'y': r'(?P<y>[0-9][0-9])',
+    'Y': r'(?P<Y>[0-9][0-9][0-9][0-9])',
+}
+
+'''
+Formats whose values fromisoformat parses exactly like strptime, mapped to the
+value length and the separator expected at each position.
+'''
+ISO_FORMATS = {
+    '%Y-%m-%d': (10, {4: '-', 7: '-'}),
+    '%Y-%m-%dT%H:%M:%S': (19, {4: '-', 7: '-', 10: 'T', 13: ':', 16: ':'}),
+    '%Y-%m-%d %H:%M:%S': (19, {4: '-', 7: '-', 10: ' ', 13: ':', 16: ':'}),
+}
+
+WHITESPACE_REGEX = re.compile(r'\s+')
+
+
+def compile_regex(formatter):
+    pattern = ''
+    index = 0
+
+    while index < len(formatter):
+        char = formatter[index]
+
+        if char == '%':
+            directive = formatter[index + 1:index + 2]
+
+            if directive == '%':
+                pattern += '%'
+            elif directive in DIRECTIVES and '(?P<{}>'.format(directive) not in pattern:
+                pattern += DIRECTIVES[directive]
+            else:
+                return None
+
+            index += 2
+            continue
+
+        whitespace = WHITESPACE_REGEX.match(formatter, index)
+
+        if whitespace:
+            pattern += r'\s+'
+            index = whitespace.end()
+            continue
+
+        pattern += re.escape(char)
+        index += 1
+
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def compile_parser(formatter):
+    '''
+    Returns a function parsing a string the same way as
+    datetime.strptime(value, formatter), or as datetime.fromisoformat when no
+    formatter is given.
+    '''
+    if formatter is None:
+        return datetime.fromisoformat
+
+    regex = compile_regex(formatter)
+
+    if regex is None:
+        return lambda value: datetime.strptime(value, formatter)
+
+    match = regex.match
+    strptime = datetime.strptime
+
+    def parse(value):
+        found = match(value) if type(value) is str else None
+
+        if found is None or found.end() != len(value):
+            return strptime(value, formatter)
+
+        fields = found.groupdict()
+
+        if 'Y' in fields:
+            year = int(fields['Y'])
+        elif 'y' in fields:
+            year = int(fields['y'])
+            year += 2000 if year <= 68 else 1900
+        else:
+            year = 1900
+
+        try:
+            return datetime(
+                year,
+                int(fields.get('m', 1)),
+                int(fields.get('d', 1)),
+                int(fields.get('H', 0)),
+                int(fields.get('M', 0)),
+                int(fields.get('S', 0)),
+                int(fields.get('f', '0').ljust(6, '0')),
+            )
+        except ValueError:
+            return strptime(value, formatter)
+
+    if formatter not in ISO_FORMATS:
+        return parse
+
+    size, separators = ISO_FORMATS[formatter]
+    fromisoformat = datetime.fromisoformat
+
+    def parse_iso(value):
+        if type(value) is str and len(value) == size and value.isascii():
+            if all(value[position] == separator for position, separator in separators.items()):
+                try:
+                    return fromisoformat(value)
+                except ValueError:
+                    pass
+
+        return parse(value)
+
+    return parse_iso
@@ -0,0 +1,59 @@
+import re
+
+
+MAX_LENGTH = 254
+MAX_LOCAL_LENGTH = 64
+MAX_LABEL_LENGTH = 63
+
+'''
+Taken from HTML spec: https://html.spec.whatwg.org/multipage/input.html#valid-e-mail-address
+The grammar is split into its local part and domain labels, so each
+piece is matched by a pattern without nested quantifiers, after its length was
+checked. Matching time is linear in the address length.
+'''
+LOCAL_PART_REGEX = re.compile(r"[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+")
+LABEL_REGEX = re.compile(r'[a-zA-Z0-9](?:[a-zA-Z0-9-]*[a-zA-Z0-9])?')
+
+
+def normalize_email(value):
+    return value.strip().lower()
+
+
+def is_email(value):
+    '''
+    Checks a normalized address against the HTML spec grammar, rejecting
+    addresses longer than 254 characters, local parts longer than 64 and domain
+    labels longer than 63 before any pattern is matched.
+    '''
+    if len(value) > MAX_LENGTH:
+        return False
+
+    local_part, separator, domain = value.partition('@')
+
+    if not separator or len(local_part) > MAX_LOCAL_LENGTH or not LOCAL_PART_REGEX.fullmatch(local_part):
+        return False
+
+    for label in domain.split('.'):
+        if len(label) > MAX_LABEL_LENGTH or not LABEL_REGEX.fullmatch(label):
+            return False
+
+    return True
+
+
+def partition_emails(values):
+    '''
+    Splits a list of raw addresses into the normalized valid ones and the
+    invalid values, in input order.
+    '''
+    valid = []
+    invalid = []
+
+    for value in values:
+        address = normalize_email(value) if isinstance(value, str) else None
+
+        if address is not None and is_email(address):
+            valid.append(address)
+        else:
+            invalid.append(value)
+
+    return valid, invalid
@@ -0,0 +1,142 @@
+from dataclasses import is_dataclass
+from inspect import Parameter, signature
+from keyword import iskeyword
+
+
+generated_classes = {}
+
+
+def is_namedtuple(object_class):
+    return isinstance(object_class, type) and issubclass(object_class, tuple) and hasattr(object_class, '_fields')
+
+
+def is_generated(object_class):
+    return getattr(object_class, '__generated_fields__', None) is not None
+
+
+def get_signature(object_class):
+    try:
+        return signature(object_class)
+    except (TypeError, ValueError):
+        return None
+
+
+def accepts_no_arguments(object_signature):
+    try:
+        object_signature.bind()
+    except TypeError:
+        return False
+
+    return True
+
+
+def accepts_keywords(object_signature, names):
+    parameters = object_signature.parameters
+
+    if any(parameter.kind == Parameter.VAR_KEYWORD for parameter in parameters.values()):
+        return True
+
+    return all(
+        name in parameters and parameters[name].kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        for name in names
+    )
+
+
+def create_hydrator(object_class, names):
+    '''
+    Picks how instances of object_class are built from a validated dict, once per
+    class: keyword construction for dataclasses, namedtuples, generated classes
+    and classes that require arguments, or a no-argument instance followed by
+    setattr for every key.
+    '''
+    object_signature = get_signature(object_class)
+
+    if object_signature is None:
+        return hydrate_dynamically(object_class)
+
+    use_keywords = names and accepts_keywords(object_signature, names) and (
+        is_dataclass(object_class) or is_namedtuple(object_class) or is_generated(object_class)
+    )
+
+    if use_keywords or not accepts_no_arguments(object_signature):
+        def hydrate(data):
+            return object_class(**data)
+
+        return hydrate
+
+    def hydrate(data):
+        instance = object_class()
+
+        for key, value in data.items():
+            setattr(instance, key, value)
+
+        return instance
+
+    return hydrate
+
+
+def hydrate_dynamically(object_class):
+    def hydrate(data):
+        try:
+            instance = object_class()
+        except TypeError:
+            return object_class(**data)
+
+        for key, value in data.items():
+            setattr(instance, key, value)
+
+        return instance
+
+    return hydrate
+
+
+def create_slots_class(class_name, fields):
+    '''
+    Generates a compact class with __slots__ and a keyword constructor for the
+    given field names. Classes are shared by name and fields, so instances can
+    be pickled and rebuilt with the same class in another process.
+    '''
+    fields = tuple(fields)
+    generated_class = generated_classes.get((class_name, fields))
+
+    if generated_class is not None:
+        return generated_class
+
+    for field in fields:
+        if not field.isidentifier() or iskeyword(field):
+            raise ValueError('Invalid field name for a generated class: {}'.format(field))
+
+    source = 'def __init__(self{}):\n{}\n'.format(
+        ''.join(', {}=None'.format(field) for field in fields),
+        '\n'.join('    self.{0} = {0}'.format(field) for field in fields) or '    pass',
+    )
+    namespace = {}
+    exec(source, namespace)
+
+    def __repr__(self):
+        return '{}({})'.format(class_name, ', '.join('{}={!r}'.format(field, getattr(self, field)) for field in fields))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, field) == getattr(other, field) for field in fields)
+
+    def __reduce__(self):
+        return rebuild_generated, (class_name, fields, tuple(getattr(self, field) for field in fields))
+
+    generated_class = type(class_name, (object,), {
+        '__slots__': fields,
+        '__generated_fields__': fields,
+        '__init__': namespace['__init__'],
+        '__repr__': __repr__,
+        '__eq__': __eq__,
+        '__hash__': None,
+        '__reduce__': __reduce__,
+    })
+
+    return generated_classes.setdefault((class_name, fields), generated_class)
+
+
+def rebuild_generated(class_name, fields, values):
+    return create_slots_class(class_name, fields)(*values)
@@ -1,28 +1,149 @@
+from threading import RLock
 from .type_handler import TypeHandler
-from .node import Node, ConstraintException
+from .node import Node
+from .schema import Schema
+from .result import BatchResult, BindResult
+from .stream import load_json, iter_json_items
+from .parallel import CHUNK_SIZE, iter_validate_parallel
 
 
 class InputHandler(object):
+    schemas = {}
+    schema_lock = RLock()
+    budget = None
+    unknown = 'ignore'
+
     def __init__(self, type_handler=None):
+        self.is_shared_schema = not type_handler
         if not type_handler:
             type_handler = TypeHandler()
         self.root_node = Node(type_handler)
+        self.schema = None
         self.input_data = None
         self.output = None
+        self.exceptions = ()
         self.errors = []
 
-    async def bind(self, input_data, defaults={}):
-        self.root_node.defaults.update(defaults)
-        self.define()
+    async def validate(self, input_data, defaults={}, **options):
+        '''
+        Validates input_data without changing the handler, so a single handler can
+        serve concurrent tasks and threads, and returns a BindResult.
+        '''
+        return BindResult(*await self.get_schema().validate(input_data, defaults, **options))
+
+    def validate_sync(self, input_data, defaults={}, **options):
+        return BindResult(*self.get_schema().validate_sync(input_data, defaults, **options))
+
+    async def bind(self, input_data, defaults={}, **options):
+        schema = self.get_schema()
 
         self.input_data = input_data
-        self.errors = []
-        self.output = None
+        self.set_result(*await schema.validate(self.input_data, defaults, **options))
+
+    def bind_sync(self, input_data, defaults={}, **options):
+        schema = self.get_schema()
+
+        self.input_data = input_data
+        self.set_result(*schema.validate_sync(self.input_data, defaults, **options))
+
+    async def rebind(self, input_data, paths, defaults={}, **options):
+        schema = self.get_schema()
+        previous = self.output
+
+        self.input_data = input_data
+        self.set_result(*await schema.revalidate(previous, self.input_data, paths, defaults, **options))
+
+    def rebind_sync(self, input_data, paths, defaults={}, **options):
+        schema = self.get_schema()
+        previous = self.output
+
+        self.input_data = input_data
+        self.set_result(*schema.revalidate_sync(previous, self.input_data, paths, defaults, **options))
+
+    async def bind_many(self, records, defaults={}, **options):
+        result = BatchResult()
+
+        async for output, errors in self.iter_bind(records, defaults, **options):
+            result.append(output, errors)
+
+        return result
+
+    def bind_many_sync(self, records, defaults={}, **options):
+        result = BatchResult()
+
+        for output, errors in self.iter_bind_sync(records, defaults, **options):
+            result.append(output, errors)
+
+        return result
+
+    def bind_many_parallel(self, records, defaults={}, workers=None, chunk_size=CHUNK_SIZE, **options):
+        result = BatchResult()
 
-        try:
-            self.output = await self.root_node.get_value(await self.root_node.walk(self.input_data))
-        except ConstraintException as e:
-            self.errors.append(e.message)
+        for output, errors in self.iter_bind_parallel(records, defaults, workers, chunk_size, **options):
+            result.append(output, errors)
+
+        return result
+
+    def iter_bind_parallel(self, records, defaults={}, workers=None, chunk_size=CHUNK_SIZE, **options):
+        return iter_validate_parallel(self.get_schema(), records, defaults, workers, chunk_size, **options)
+
+    async def iter_bind(self, records, defaults={}, **options):
+        async for output, errors in self.get_schema().iter_validate(records, defaults, **options):
+            yield output, [error.message for error in errors]
+
+    def iter_bind_sync(self, records, defaults={}, **options):
+        for output, errors in self.get_schema().iter_validate_sync(records, defaults, **options):
+            yield output, [error.message for error in errors]
+
+    async def bind_json(self, source, defaults={}, **options):
+        await self.bind(load_json(source, self.get_schema().root_node), defaults, **options)
+
+    def bind_json_sync(self, source, defaults={}, **options):
+        self.bind_sync(load_json(source, self.get_schema().root_node), defaults, **options)
+
+    def iter_bind_json(self, source, prefix='', defaults={}, **options):
+        return self.iter_bind(iter_json_items(source, prefix, self.get_schema().root_node), defaults, **options)
+
+    def iter_bind_json_sync(self, source, prefix='', defaults={}, **options):
+        return self.iter_bind_sync(iter_json_items(source, prefix, self.get_schema().root_node), defaults, **options)
+
+    def set_result(self, output, exceptions):
+        self.output = output
+        self.exceptions = tuple(exceptions)
+        self.errors = [exception.message for exception in exceptions]
+
+    def get_schema(self):
+        if self.schema:
+            return self.schema
+
+        with InputHandler.schema_lock:
+            return self.build_schema()
+
+    def build_schema(self):
+        if self.schema:
+            return self.schema
+
+        handler_class = type(self)
+        is_shared_schema = self.is_shared_schema and not self.root_node.has_children()
+        schema = InputHandler.schemas.get(handler_class) if is_shared_schema else None
+
+        if not schema:
+            self.root_node.set_unknown(self.unknown)
+            self.define()
+            schema = Schema(self.root_node, self.budget)
+
+            if is_shared_schema:
+                InputHandler.schemas[handler_class] = schema
+
+        self.schema = schema
+        self.root_node = schema.root_node
+        return schema
+
+    def dump(self, data):
+        return self.get_schema().dump(data)
+
+    def dump_json(self, data):
+        return self.get_schema().dump_json(data)
 
     def add(self, name, node_type, options=None):
         return self.root_node.add(name, node_type, options)
@@ -33,8 +154,11 @@ class InputHandler(object):
     def is_valid(self):
         return len(self.errors) == 0
 
-    def get_error_as_string(self):
-        if not self.errors:
-            return None
+    def get_result(self):
+        return BindResult(self.output, self.exceptions)
 
-        return ','.join(self.errors)
+    def get_errors(self):
+        return self.get_result().get_errors()
+
+    def get_error_as_string(self):
+        return self.get_result().get_error_as_string()
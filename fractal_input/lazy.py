@@ -0,0 +1,233 @@
+from collections.abc import Mapping, Sequence
+from .constraint import RequiredConstraint, ConstraintException
+from .node import Node, ListNode, ObjectNode
+
+
+def is_lazy(node):
+    '''
+    Containers without constraints other than required, cache, custom transform
+    or unknown key policy can be validated child by child, on access.
+    '''
+    if node.cache is not None or not all(isinstance(constraint, RequiredConstraint) for constraint in node.constraints):
+        return False
+
+    if isinstance(node, ListNode):
+        return not node.as_array and type(node).coerce is ListNode.coerce and is_lazy(node.get_inner_node())
+
+    return node.has_fields() and node.unknown == 'ignore' and type(node).coerce is Node.coerce
+
+
+def get_required_message(node):
+    for constraint in node.constraints:
+        if isinstance(constraint, RequiredConstraint):
+            return constraint.message.replace('{field}', node.name)
+
+    return None
+
+
+def get_child_value(child, value):
+    if child.name in value:
+        return value[child.name]
+
+    return child.default
+
+
+def is_present(child, value):
+    return child.name in value or child.is_required or child.default is not None
+
+
+def check_required(node, value):
+    '''
+    Raises for the first missing required value of the lazy containers of the
+    tree. Containers that cannot be lazy, and values that are not of the type
+    of their container node, are validated right away. Scalars are left for the
+    first access.
+    '''
+    if value is None:
+        message = get_required_message(node)
+
+        if message is not None:
+            raise ConstraintException(message)
+
+        return
+
+    if not is_lazy(node):
+        if isinstance(node, ListNode) or node.children:
+            node.get_validator()(value)
+
+        return
+
+    if isinstance(node, ListNode) and not isinstance(value, list) or node.children and not isinstance(value, dict):
+        node.get_validator()(value)
+        return
+
+    if isinstance(node, ListNode):
+        item_node = node.get_inner_node()
+
+        for index, item in enumerate(value):
+            try:
+                check_required(item_node, item)
+            except ConstraintException as e:
+                e.prepend_path(index)
+                raise
+
+        return
+
+    for child in node.children:
+        try:
+            check_required(child, get_child_value(child, value))
+        except ConstraintException as e:
+            e.prepend_path(child.name)
+            raise
+
+
+def create_proxy(node, value):
+    '''
+    Returns a proxy validating value on access when node is a lazy container,
+    otherwise the validated value.
+    '''
+    if value is None or not is_lazy(node):
+        return node.get_validator()(value)
+
+    if isinstance(node, ListNode):
+        return LazyList(node, value) if isinstance(value, list) else node.get_validator()(value)
+
+    if not isinstance(value, dict):
+        return node.get_validator()(value)
+
+    if isinstance(node, ObjectNode) and node.default is None:
+        return LazyObject(node, value)
+
+    if isinstance(node, ObjectNode):
+        return node.get_validator()(value)
+
+    return LazyDict(node, value)
+
+
+def resolve_child(child, value, key):
+    try:
+        return create_proxy(child, value)
+    except ConstraintException as e:
+        e.prepend_path(key)
+        raise
+
+
+class LazyDict(Mapping):
+    '''
+    Read-only mapping validating each child the first time it is read. Invalid
+    children raise ConstraintException on access.
+    '''
+    __slots__ = ('children', 'value', 'data')
+
+    def __init__(self, node, value):
+        self.children = {name: child for name, child in node.get_child_index().items() if is_present(child, value)}
+        self.value = value
+        self.data = {}
+
+    def __getitem__(self, key):
+        if key in self.data:
+            return self.data[key]
+
+        child = self.children[key]
+        result = self.data[key] = resolve_child(child, get_child_value(child, self.value), key)
+        return result
+
+    def __iter__(self):
+        return iter(self.children)
+
+    def __len__(self):
+        return len(self.children)
+
+    def __repr__(self):
+        return 'LazyDict({!r})'.format(dict(self))
+
+
+class LazyList(Sequence):
+    __slots__ = ('item_node', 'values', 'items')
+
+    def __init__(self, node, values):
+        self.item_node = node.get_inner_node()
+        self.values = values
+        self.items = [None] * len(values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self.values)))]
+
+        if index < 0:
+            index += len(self.values)
+
+        if not 0 <= index < len(self.values):
+            raise IndexError('list index out of range')
+
+        item = self.items[index]
+
+        if item is None and self.values[index] is not None:
+            item = self.items[index] = resolve_child(self.item_node, self.values[index], index)
+
+        return item
+
+    def __len__(self):
+        return len(self.values)
+
+    def __eq__(self, other):
+        return isinstance(other, (list, LazyList)) and list(self) == list(other)
+
+    def __repr__(self):
+        return 'LazyList({!r})'.format(list(self))
+
+
+class LazyObject(object):
+    '''
+    Stands for an instance of the object class of an ObjectNode, validating
+    each field on first access. unwrap() validates the remaining fields and
+    returns the hydrated instance.
+    '''
+    __slots__ = ('_node', '_data', '_instance')
+
+    def __init__(self, node, value):
+        object.__setattr__(self, '_node', node)
+        object.__setattr__(self, '_data', LazyDict(node, value))
+        object.__setattr__(self, '_instance', None)
+
+    @property
+    def __class__(self):
+        return self._node.get_object_class()
+
+    def __getattr__(self, name):
+        if self._instance is not None:
+            return getattr(self._instance, name)
+
+        if name in self._data.children:
+            return self._data[name]
+
+        return getattr(self.unwrap(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.unwrap(), name, value)
+
+    def unwrap(self):
+        if self._instance is None:
+            object.__setattr__(self, '_instance', self._node.hydrate({key: unwrap(value) for key, value in self._data.items()}))
+
+        return self._instance
+
+    def __repr__(self):
+        return repr(self.unwrap())
+
+
+def unwrap(value):
+    '''
+    Validates everything left in a lazy result and returns plain dicts, lists
+    and hydrated objects.
+    '''
+    if isinstance(value, LazyDict):
+        return {key: unwrap(item) for key, item in value.items()}
+
+    if isinstance(value, LazyList):
+        return [unwrap(item) for item in value]
+
+    if type(value) is LazyObject:
+        return value.unwrap()
+
+    return value
@@ -1,19 +1,72 @@
-import re
-from datetime import datetime
-from .constraint import RequiredConstraint, ConstraintException
+from asyncio import gather
+from collections.abc import Mapping
+from inspect import isawaitable, iscoroutinefunction
+from operator import is_
+from copy import copy
+from functools import lru_cache
+from threading import Lock
+from .constraint import RequiredConstraint, DeclarativeConstraint, ConstraintException, ConstraintErrors
+from .context import bind_context, collect_error
+from .cache import TransformCache
+from .date_parser import compile_parser
+from .email_address import is_email, normalize_email
+from .hydrator import create_hydrator, create_slots_class
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 '''
-Taken from HTML spec: https://html.spec.whatwg.org/multipage/input.html#valid-e-mail-address
+Coroutine methods that, when overridden outside this module, may perform I/O and
+prevent a node from being compiled into a synchronous validator. Constraints with
+a coroutine validate() have the same effect.
 '''
-EMAIL_REGEX = (
-    r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@"
-    r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
-    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-)
+ASYNC_METHODS = ('transform', 'check_constraints', 'get_value', 'walk', 'resolve')
+
+'''
+What a dict node does with keys that are not children: drop them, report each
+of them as an error or copy them to the output.
+'''
+UNKNOWN_POLICIES = ('ignore', 'reject', 'keep')
+
+
+class FrozenNodeException(Exception):
+    pass
+
+
+def dump_identity(value):
+    return value
+
+
+def reuse_list(values, result):
+    if isinstance(values, list) and len(values) == len(result) and all(map(is_, result, values)):
+        return values
+
+    return result
+
+
+def validate_each(item_validator, values):
+    result = []
+    errors = None
+
+    for index, value in enumerate(values):
+        try:
+            result.append(item_validator(value))
+        except ConstraintException as e:
+            e.prepend_path(index)
+            errors = collect_error(e, errors)
+
+    if errors:
+        raise ConstraintErrors(errors)
+
+    return result
 
 
 class Node(object):
+    is_keyed = True
+
     def __init__(self, type_handler=None):
         self.name = 'root'
         self.children = []
@@ -22,21 +75,109 @@ class Node(object):
         self.is_required = True
         self.defaults = {}
         self.default = None
+        self.frozen = False
+        self.validators = {}
+        self.cache = None
+        self.path = None
+        self.unknown = 'ignore'
+        self.child_index = None
+        self.dumper = None
 
     def has_children(self):
         return len(self.children) > 0
 
-    async def transform(self, value):
+    def has_fields(self):
+        '''
+        Whether children are fields of a dict value, walked by name.
+        '''
+        return self.has_children()
+
+    def coerce(self, value):
         return value
 
-    async def get_value(self, value):
+    async def transform(self, value):
+        return self.coerce(value)
+
+    async def check_constraints(self, value):
         for constraint in self.constraints:
-            if not constraint.validate(value):
+            is_valid = constraint.validate(value)
+
+            if isawaitable(is_valid):
+                is_valid = await is_valid
+
+            if not is_valid:
                 raise ConstraintException(constraint.message.replace('{field}', self.name))
 
-        value = await self.transform(value)
+    async def get_value(self, value):
+        context = bind_context.get()
 
-        return value
+        if context is not None and context.profiler is not None:
+            return await context.profiler.profile_value(self, value)
+
+        await self.check_constraints(value)
+
+        return await self.apply_transform(value)
+
+    async def apply_transform(self, value):
+        if self.cache is not None:
+            return await self.cache.get(value, self.transform)
+
+        return await self.transform(value)
+
+    async def resolve(self, value):
+        context = bind_context.get()
+
+        if context is not None and context.profiler is not None:
+            return await context.profiler.profile(self, value, context)
+
+        trusted = context is not None and context.trusted
+        validator = self.get_validator(trusted) if self.frozen else None
+
+        if validator is not None:
+            return validator(value)
+
+        return await self.resolve_walk(value, context)
+
+    async def resolve_walk(self, value, context):
+        value = await self.walk(value)
+        semaphore = context.get_semaphore() if context is not None else None
+
+        if semaphore is None:
+            return await self.get_value(value)
+
+        async with semaphore:
+            return await self.get_value(value)
+
+    async def resolve_all(self, items):
+        '''
+        Resolves (key, node, value) items in order, or concurrently when the bind
+        sets a concurrency limit, and returns their values in the same order.
+        '''
+        context = bind_context.get()
+        results = []
+        errors = None
+
+        if context is not None and context.concurrency and len(items) > 1:
+            outcomes = await gather(*(node.resolve(value) for key, node, value in items), return_exceptions=True)
+        else:
+            outcomes = None
+
+        for index, (key, node, value) in enumerate(items):
+            try:
+                if outcomes is None:
+                    results.append(await node.resolve(value))
+                elif isinstance(outcomes[index], BaseException):
+                    raise outcomes[index]
+                else:
+                    results.append(outcomes[index])
+            except ConstraintException as e:
+                e.prepend_path(key)
+                errors = collect_error(e, errors)
+
+        if errors:
+            raise ConstraintErrors(errors)
+
+        return results
 
     async def walk(self, value):
         if not isinstance(value, dict):
@@ -45,21 +186,77 @@ class Node(object):
         if not self.has_children():
             return value
 
-        result = {}
+        items = []
 
         for child in self.children:
-            if child.name not in value and not child.is_required:
+            if child.name in value:
+                child_value = value[child.name]
+            elif not child.is_required:
                 if child.default is None:
                     continue
 
-                value[child.name] = child.default
+                child_value = child.default
+            else:
+                child_value = None
+
+            items.append((child.name, child, child_value))
+
+        try:
+            results = await self.resolve_all(items)
+        except ConstraintErrors as e:
+            if self.unknown == 'reject' and not e.is_limited:
+                raise ConstraintErrors(self.reject_unknown(value, e.errors))
+
+            raise
+
+        if self.unknown == 'reject':
+            errors = self.reject_unknown(value, None)
 
-            child_value = value.get(child.name, None)
-            result[child.name] = await child.get_value(await child.walk(child_value))
+            if errors:
+                raise ConstraintErrors(errors)
+
+        context = bind_context.get()
+
+        if context is not None and context.trusted and len(items) == len(value):
+            if all(key in value and result is child_value for (key, node, child_value), result in zip(items, results)):
+                return value
+
+        result = {key: result for (key, node, child_value), result in zip(items, results)}
+
+        if self.unknown == 'keep':
+            self.keep_unknown(value, result)
 
         return result
 
+    def get_child_index(self):
+        '''
+        Returns the children by name, computed once when the node is frozen.
+        '''
+        if self.child_index is not None:
+            return self.child_index
+
+        return {child.name: child for child in self.children}
+
+    def reject_unknown(self, value, errors):
+        unknown_keys = value.keys() - self.get_child_index().keys()
+
+        for key in sorted(unknown_keys, key=str):
+            errors = collect_error(ConstraintException('{} is not allowed'.format(key), [key]), errors)
+
+        return errors
+
+    def keep_unknown(self, value, result):
+        child_index = self.get_child_index()
+
+        if value.keys() - child_index.keys():
+            for key in value:
+                if key not in child_index:
+                    result[key] = value[key]
+
     def add(self, name, node_type, options=None):
+        if self.frozen:
+            raise FrozenNodeException('Cannot add {} to {}: node is frozen'.format(name, self.name))
+
         node = self.type_handler.create_node(node_type)
 
         if name in self.defaults:
@@ -83,54 +280,309 @@ class Node(object):
         if 'constraints' in options:
             self.constraints.extend(options['constraints'])
 
+        if options.get('cache'):
+            self.cache = self.create_cache(options['cache'])
 
-class StringNode(Node):
-    async def transform(self, value):
-        if value is None:
-            return None
+        if 'unknown' in options:
+            self.set_unknown(options['unknown'])
 
-        return str(value)
+    def set_unknown(self, policy):
+        if policy not in UNKNOWN_POLICIES:
+            raise ValueError('Invalid unknown key policy: {}'.format(policy))
 
+        if policy != 'ignore' and not self.is_keyed:
+            raise ValueError('Unknown key policies only apply to nodes with fields')
 
-class IntegerNode(Node):
-    async def transform(self, value):
-        if value is None:
+        self.unknown = policy
+
+    def create_cache(self, cache):
+        if isinstance(cache, TransformCache):
+            return cache
+
+        if isinstance(cache, dict):
+            return TransformCache(**cache)
+
+        return TransformCache()
+
+    def freeze(self, path=''):
+        for child in self.children:
+            child.freeze('{}/{}'.format(path, child.name))
+
+        self.path = path
+        self.child_index = {child.name: child for child in self.children}
+        self.frozen = True
+
+    def copy(self):
+        node = copy(self)
+        node.validators = {}
+        return node
+
+    def with_default(self, default):
+        node = self.copy()
+        node.default = default
+        return node
+
+    def is_sync(self):
+        node_class = type(self)
+
+        if any(iscoroutinefunction(constraint.validate) for constraint in self.constraints):
+            return False
+
+        return all(getattr(node_class, method).__module__ == __name__ for method in ASYNC_METHODS)
+
+    def get_validator(self, trusted=False):
+        if trusted in self.validators:
+            return self.validators[trusted]
+
+        validator = self.compile(trusted)
+
+        if self.frozen:
+            self.validators[trusted] = validator
+
+        return validator
+
+    def compile_many(self):
+        return None
+
+    def compile_cache(self, coerce):
+        get_cached = self.cache.get_sync
+
+        def cached_coerce(value):
+            return get_cached(value, coerce)
+
+        return cached_coerce
+
+    def compile_constraints(self):
+        '''
+        Returns the message raised when a value is missing and a list of
+        (validate, message) pairs for the remaining constraints.
+        '''
+        required_message = None
+        checks = []
+
+        for constraint in self.constraints:
+            message = constraint.message.replace('{field}', self.name)
+
+            if isinstance(constraint, RequiredConstraint) and not checks and required_message is None:
+                required_message = message
+            elif isinstance(constraint, DeclarativeConstraint):
+                checks.append((constraint.check, message))
+            else:
+                checks.append((constraint.validate, message))
+
+        return required_message, checks
+
+    def compile(self, trusted=False):
+        if not self.is_sync():
             return None
 
-        return int(value)
+        children = []
 
+        for child in self.children:
+            child_validator = child.get_validator(trusted)
 
-class FloatNode(Node):
-    async def transform(self, value):
+            if child_validator is None:
+                return None
+
+            children.append((child.name, child.is_required, child.default, child_validator))
+
+        required_message, checks = self.compile_constraints()
+        coerce = None if type(self).coerce is Node.coerce else self.coerce
+        unknown = self.unknown
+        reject_unknown = self.reject_unknown
+        keep_unknown = self.keep_unknown
+
+        if coerce is not None and self.cache is not None:
+            coerce = self.compile_cache(coerce)
+
+        def validate(value):
+            if children and isinstance(value, dict):
+                result = {}
+                errors = None
+                is_unchanged = trusted
+
+                for name, is_required, default, child_validator in children:
+                    if name in value:
+                        child_value = value[name]
+                    elif not is_required:
+                        if default is None:
+                            continue
+
+                        child_value = default
+                        is_unchanged = False
+                    else:
+                        child_value = None
+
+                    try:
+                        child_result = result[name] = child_validator(child_value)
+                    except ConstraintException as e:
+                        e.prepend_path(name)
+                        errors = collect_error(e, errors)
+                        continue
+
+                    if is_unchanged and child_result is not child_value:
+                        is_unchanged = False
+
+                if unknown == 'reject':
+                    errors = reject_unknown(value, errors)
+
+                if errors:
+                    raise ConstraintErrors(errors)
+
+                if unknown == 'keep':
+                    keep_unknown(value, result)
+
+                if not is_unchanged or len(result) != len(value):
+                    value = result
+
+            if value is None and required_message is not None:
+                raise ConstraintException(required_message)
+
+            for check, message in checks:
+                if not check(value):
+                    raise ConstraintException(message)
+
+            if coerce is None:
+                return value
+
+            return coerce(value)
+
+        return validate
+
+    def get_dumper(self):
+        if self.dumper is not None:
+            return self.dumper
+
+        dumper = self.compile_dumper()
+
+        if self.frozen:
+            self.dumper = dumper
+
+        return dumper
+
+    def compile_dumper(self):
+        '''
+        Returns a function turning an output of this node back into JSON
+        compatible values, reading only the declared fields of dicts and objects.
+        '''
+        if not self.has_fields():
+            return dump_identity
+
+        fields = []
+
+        for child in self.children:
+            dump_child = child.get_dumper()
+            fields.append((child.name, None if dump_child is dump_identity else dump_child))
+
+        child_index = self.get_child_index()
+        keep_unknown = self.unknown == 'keep'
+
+        def dump(value):
+            if value is None:
+                return None
+
+            result = {}
+
+            if isinstance(value, dict) or isinstance(value, Mapping):
+                for name, dump_child in fields:
+                    if name in value:
+                        result[name] = value[name] if dump_child is None else dump_child(value[name])
+
+                if keep_unknown and len(result) != len(value):
+                    for key in value:
+                        if key not in child_index:
+                            result[key] = value[key]
+
+                return result
+
+            for name, dump_child in fields:
+                child_value = getattr(value, name, None)
+                result[name] = child_value if dump_child is None else dump_child(child_value)
+
+            return result
+
+        return dump
+
+
+class ScalarNode(Node):
+    scalar_type = None
+    is_keyed = False
+
+    def coerce(self, value):
         if value is None:
             return None
 
-        return float(value)
+        return self.scalar_type(value)
 
+    def compile_many(self):
+        '''
+        Returns a function validating a whole list of values at once, checking
+        built-in constraints in a single pass over the list. Items are validated
+        one by one, to report their errors, only when the list is invalid.
+        '''
+        if self.children or self.cache or not self.is_sync() or type(self).coerce is not ScalarNode.coerce:
+            return None
 
-class BooleanNode(Node):
-    async def transform(self, value):
-        if value is None:
+        if not all(isinstance(constraint, DeclarativeConstraint) for constraint in self.constraints):
             return None
 
-        return bool(value)
+        scalar_type = self.scalar_type
+        checks = [constraint.compile_many() for constraint in self.constraints]
+        item_validator = self.get_validator() if checks else None
+
+        def coerce_many(values):
+            if not isinstance(values, list):
+                values = list(values)
+
+            has_none = None in values
+
+            if checks:
+                present = [value for value in values if value is not None] if has_none else values
+
+                if not all(check(present) for check in checks):
+                    return validate_each(item_validator, values)
+
+            if has_none:
+                return [None if value is None else scalar_type(value) for value in values]
+
+            return list(map(scalar_type, values))
+
+        return coerce_many
+
+
+class StringNode(ScalarNode):
+    scalar_type = str
+
+
+class IntegerNode(ScalarNode):
+    scalar_type = int
+
+
+class FloatNode(ScalarNode):
+    scalar_type = float
+
+
+class BooleanNode(ScalarNode):
+    scalar_type = bool
 
 
 class ObjectNode(Node):
-    def __init__(self, object_class, type_handler=None):
+    def __init__(self, object_class=None, type_handler=None):
         super(ObjectNode, self).__init__(type_handler)
         self.object_class = object_class
+        self.hydrator = None
 
     async def get_value(self, input_value):
-        for constraint in self.constraints:
-            if not constraint.validate(input_value):
-                raise ConstraintException(constraint.message.replace('{field}', self.name))
+        await self.check_constraints(input_value)
 
         if input_value is None:
             return None
 
         data = await super(ObjectNode, self).get_value(input_value)
 
+        return self.hydrate(data)
+
+    def hydrate(self, data):
         if not isinstance(data, dict):
             raise ConstraintException('Invalid field {}: {}'.format(self.name, data))
 
@@ -142,79 +594,488 @@ class ObjectNode(Node):
 
             return instance
 
-        try:
-            instance = self.object_class()
-            for key in data:
-                setattr(instance, key, data[key])
-        except TypeError:
-            instance = self.object_class(**data)
+        return self.get_hydrator()(data)
+
+    def set_unknown(self, policy):
+        if policy == 'keep':
+            raise ValueError('Unknown keys cannot be kept by object nodes')
+
+        super(ObjectNode, self).set_unknown(policy)
+
+    def get_object_class(self):
+        if self.object_class is None:
+            return create_slots_class(self.name, [child.name for child in self.children])
+
+        return self.object_class
+
+    def get_hydrator(self):
+        if self.hydrator is not None:
+            return self.hydrator
+
+        hydrator = create_hydrator(self.get_object_class(), [child.name for child in self.children])
+
+        if self.frozen:
+            self.hydrator = hydrator
+
+        return hydrator
+
+    def freeze(self, path=''):
+        super(ObjectNode, self).freeze(path)
+
+        if self.object_class is None:
+            self.object_class = self.get_object_class()
+
+    def compile(self, trusted=False):
+        validate_data = super(ObjectNode, self).compile(trusted)
+
+        if validate_data is None:
+            return None
 
-        return instance
+        hydrate = self.hydrate
+
+        def validate(value):
+            data = validate_data(value)
+
+            if data is None:
+                return None
+
+            return hydrate(data)
+
+        return validate
 
 
 class DatetimeNode(Node):
-    def __init__(self, formatter=None):
+    is_keyed = False
+
+    def __init__(self, formatter=None, cache_size=0):
         super(DatetimeNode, self).__init__()
         self.formatter = formatter
+        self.cache_size = cache_size
+        self.parser = None
 
-    async def transform(self, value):
+    def get_parser(self):
+        if self.parser is None:
+            parser = compile_parser(self.formatter)
+
+            if self.cache_size:
+                parser = lru_cache(maxsize=self.cache_size)(parser)
+
+            self.parser = parser
+
+        return self.parser
+
+    def coerce(self, value):
         if value is None:
             return None
 
         try:
-            return datetime.strptime(value, self.formatter)
+            return self.get_parser()(value)
         except ValueError as e:
             raise ConstraintException('Invalid {}: {}'.format(self.name, str(e)))
 
+    def compile_dumper(self):
+        formatter = self.formatter
+
+        def dump(value):
+            if value is None:
+                return None
+
+            if formatter is None:
+                return value.isoformat()
+
+            return value.strftime(formatter)
+
+        return dump
+
 
 class EmailNode(StringNode):
     def __init__(self):
         super(EmailNode, self).__init__()
 
-    async def transform(self, value):
-        value = await super(EmailNode, self).transform(value)
+    def coerce(self, value):
+        value = super(EmailNode, self).coerce(value)
 
         if value is None:
             return None
 
-        normalized_value = value.strip().lower()
+        normalized_value = normalize_email(value)
 
-        if not re.match(EMAIL_REGEX, normalized_value):
+        if not is_email(normalized_value):
             raise ConstraintException('Invalid {}: {} is not a valid email address'.format(self.name, value))
 
         return normalized_value
 
+    def compile_many(self):
+        if self.children or self.constraints or self.cache or not self.is_sync() or type(self).coerce is not EmailNode.coerce:
+            return None
+
+        item_validator = self.get_validator()
+
+        def coerce_many(values):
+            if not isinstance(values, list):
+                values = list(values)
+
+            result = [None if value is None else normalize_email(str(value)) for value in values]
+
+            if all(value is None or is_email(value) for value in result):
+                return result
+
+            return validate_each(item_validator, values)
+
+        return coerce_many
+
 
 class ListNode(Node):
     def __init__(self, inner_node_type, type_handler=None):
         super(ListNode, self).__init__(type_handler)
         self.inner_node_type = inner_node_type
         self.inner_node = None
+        self.as_array = False
 
     def get_inner_node(self):
         if not self.inner_node:
             self.inner_node = self.type_handler.create_node(self.inner_node_type)
         return self.inner_node
 
+    def configure(self, name, options=None):
+        super(ListNode, self).configure(name, options)
+
+        if options:
+            self.as_array = options.get('array', False)
+
+        if options and 'item_constraints' in options:
+            item_node = self.get_inner_node()
+            item_node.name = name
+            item_node.constraints.extend(options['item_constraints'])
+
+    def set_unknown(self, policy):
+        self.get_inner_node().set_unknown(policy)
+
+    def coerce(self, values):
+        if not self.as_array or values is None or numpy is None:
+            return values
+
+        scalar_type = getattr(self.get_inner_node(), 'scalar_type', None)
+
+        if scalar_type not in (int, float, bool) or None in values:
+            return values
+
+        try:
+            return numpy.array(values, dtype=scalar_type)
+        except OverflowError:
+            return values
+
     async def walk(self, values):
         if not self.isiterable(values):
             return None
 
-        result = []
+        item_node = self.get_inner_node()
+        coerce_many = item_node.compile_many() if self.frozen else None
 
-        for value in values:
-            item_node = self.get_inner_node()
-            item_value = await item_node.get_value(await item_node.walk(value))
-            result.append(item_value)
+        if coerce_many is not None:
+            result = coerce_many(values)
+        else:
+            result = await self.resolve_all([(index, item_node, value) for index, value in enumerate(values)])
+
+        context = bind_context.get()
+
+        if context is not None and context.trusted:
+            return reuse_list(values, result)
 
         return result
 
     def add(self, name, node_type, options=None):
         return self.get_inner_node().add(name, node_type, options)
 
+    def freeze(self, path=''):
+        self.get_inner_node().freeze(path + '/*')
+        super(ListNode, self).freeze(path)
+
     def isiterable(self, value):
         try:
             iter(value)
         except TypeError:
             return False
         return True
+
+    def compile(self, trusted=False):
+        if not self.is_sync():
+            return None
+
+        coerce_many = self.get_inner_node().compile_many()
+
+        if coerce_many is None:
+            item_validator = self.get_inner_node().get_validator(trusted)
+
+            if item_validator is None:
+                return None
+
+            def coerce_many(values):
+                return validate_each(item_validator, values)
+
+        required_message, checks = self.compile_constraints()
+        isiterable = self.isiterable
+        coerce = self.coerce if self.as_array else None
+
+        def validate(values):
+            if not isiterable(values):
+                values = None
+            elif trusted:
+                values = reuse_list(values, coerce_many(values))
+            else:
+                values = coerce_many(values)
+
+            if values is None and required_message is not None:
+                raise ConstraintException(required_message)
+
+            for check, message in checks:
+                if not check(values):
+                    raise ConstraintException(message)
+
+            if coerce is None:
+                return values
+
+            return coerce(values)
+
+        return validate
+
+    def compile_dumper(self):
+        dump_item = self.get_inner_node().get_dumper()
+
+        def dump(values):
+            if values is None:
+                return None
+
+            if numpy is not None and isinstance(values, numpy.ndarray):
+                return values.tolist()
+
+            if dump_item is dump_identity:
+                return list(values)
+
+            return [dump_item(value) for value in values]
+
+        return dump
+
+
+class UnionNode(Node):
+    '''
+    Validates a dict against one of its children, the variants. With a
+    discriminator, the variant is the child named after the value of that key.
+    Otherwise variants are tried in turn, the most recently matched first.
+    '''
+
+    is_keyed = False
+    match_window = 1024
+
+    def __init__(self, discriminator=None, type_handler=None):
+        super(UnionNode, self).__init__(type_handler)
+        self.discriminator = discriminator
+        self.variants = None
+        self.matches = {}
+        self.match_total = 0
+        self.candidates = []
+        self.lock = Lock()
+
+    def has_fields(self):
+        return False
+
+    def configure(self, name, options=None):
+        super(UnionNode, self).configure(name, options)
+
+        if options and 'discriminator' in options:
+            self.discriminator = options['discriminator']
+
+    def add(self, name, node_type, options=None):
+        node = super(UnionNode, self).add(name, node_type, options)
+        self.candidates.append(node)
+        return node
+
+    def freeze(self, path=''):
+        super(UnionNode, self).freeze(path)
+        self.variants = self.get_variants()
+
+    def get_variants(self):
+        if self.variants is not None:
+            return self.variants
+
+        return {child.name: child for child in self.children}
+
+    def check_object(self, value):
+        if not isinstance(value, dict):
+            raise ConstraintException('Invalid {}: {} is not an object'.format(self.name, value))
+
+    def select(self, value):
+        try:
+            variant = self.get_variants().get(value.get(self.discriminator))
+        except TypeError:
+            variant = None
+
+        if variant is None:
+            raise ConstraintException('Invalid {}: unknown {} {}'.format(self.name, self.discriminator, value.get(self.discriminator)))
+
+        return variant
+
+    def count_match(self, variant):
+        '''
+        Counts a match of variant and moves it ahead of the previous candidate
+        once it has matched more often. Counts are halved every match_window
+        matches, so the order follows recent matches rather than all-time
+        totals. Counts may miss concurrent increments, only reordering and
+        halving take the lock.
+        '''
+        matches = self.matches
+        count = matches[variant.name] = matches.get(variant.name, 0) + 1
+        self.match_total += 1
+
+        if self.match_total >= self.match_window:
+            self.decay_matches()
+
+        index = self.candidates.index(variant)
+
+        if index > 0 and matches.get(self.candidates[index - 1].name, 0) < count:
+            with self.lock:
+                index = self.candidates.index(variant)
+
+                if index > 0:
+                    self.candidates[index - 1], self.candidates[index] = variant, self.candidates[index - 1]
+
+    def decay_matches(self):
+        with self.lock:
+            if self.match_total >= self.match_window:
+                self.matches = {name: count // 2 for name, count in self.matches.items()}
+                self.match_total = 0
+
+    def try_each(self, value, resolve):
+        context = bind_context.get()
+        error_count = context.error_count if context is not None else 0
+
+        for variant in tuple(self.candidates):
+            try:
+                result = resolve(variant, value)
+            except ConstraintException:
+                if context is not None:
+                    context.error_count = error_count
+
+                continue
+
+            self.count_match(variant)
+            return result
+
+        raise ConstraintException('Invalid {}: value does not match any variant'.format(self.name))
+
+    async def walk(self, value):
+        if value is None:
+            return None
+
+        self.check_object(value)
+
+        if self.discriminator is not None:
+            return await self.select(value).resolve(value)
+
+        context = bind_context.get()
+        error_count = context.error_count if context is not None else 0
+
+        for variant in tuple(self.candidates):
+            try:
+                result = await variant.resolve(value)
+            except ConstraintException:
+                if context is not None:
+                    context.error_count = error_count
+
+                continue
+
+            self.count_match(variant)
+            return result
+
+        raise ConstraintException('Invalid {}: value does not match any variant'.format(self.name))
+
+    def compile(self, trusted=False):
+        if not self.is_sync():
+            return None
+
+        validators = {}
+
+        for child in self.children:
+            validators[child.name] = child.get_validator(trusted)
+
+            if validators[child.name] is None:
+                return None
+
+        required_message, checks = self.compile_constraints()
+        discriminator = self.discriminator
+        check_object = self.check_object
+        select = self.select
+        try_each = self.try_each
+
+        def resolve(variant, value):
+            return validators[variant.name](value)
+
+        def validate(value):
+            if value is not None:
+                check_object(value)
+
+            if value is not None and discriminator is not None:
+                value = validators[select(value).name](value)
+            elif value is not None:
+                value = try_each(value, resolve)
+
+            if value is None and required_message is not None:
+                raise ConstraintException(required_message)
+
+            for check, message in checks:
+                if not check(value):
+                    raise ConstraintException(message)
+
+            return value
+
+        return validate
+
+    def compile_dumper(self):
+        discriminator = self.discriminator
+        variants = self.get_variants()
+        dumpers = {child.name: child.get_dumper() for child in self.children}
+        candidates = tuple(
+            (child, getattr(child, 'object_class', None), frozenset(field.name for field in child.children if field.is_required))
+            for child in self.children
+        )
+
+        def select(value):
+            if discriminator is not None:
+                key = value.get(discriminator) if isinstance(value, Mapping) else getattr(value, discriminator, None)
+
+                try:
+                    variant = variants.get(key)
+                except TypeError:
+                    variant = None
+
+                # Variants without a field for the discriminator lose its value
+                # when hydrated, so they are found by their class or fields
+                if variant is not None:
+                    return variant
+
+            for variant, object_class, required_names in candidates:
+                if isinstance(value, Mapping) and required_names <= value.keys():
+                    return variant
+
+                if object_class is not None and isinstance(value, object_class):
+                    return variant
+
+            return None
+
+        def dump(value):
+            if value is None:
+                return None
+
+            variant = select(value)
+
+            if variant is None:
+                raise ValueError('Cannot dump {}: no variant matches {!r}'.format(self.name, value))
+
+            result = dumpers[variant.name](value)
+
+            if discriminator is not None and isinstance(result, dict) and result.get(discriminator) is None:
+                result[discriminator] = variant.name
+
+            return result
+
+        return dump
@@ -0,0 +1,68 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from os import cpu_count
+from .schema import Schema
+
+
+CHUNK_SIZE = 1000
+
+# Options whose state cannot cross process boundaries
+LOCAL_OPTIONS = ('profiler', 'lazy')
+
+worker_state = None
+
+
+def init_worker(spec, defaults, options):
+    global worker_state
+
+    worker_state = (Schema.from_spec(spec), defaults, options)
+
+
+def validate_chunk(records):
+    schema, defaults, options = worker_state
+
+    return [
+        (output, [error.message for error in errors])
+        for output, errors in schema.iter_validate_sync(records, defaults, **options)
+    ]
+
+
+def iter_chunks(records, chunk_size):
+    records = iter(records)
+
+    while True:
+        chunk = list(islice(records, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def iter_validate_parallel(schema, records, defaults=None, workers=None, chunk_size=CHUNK_SIZE, **options):
+    '''
+    Validates records in a pool of worker processes. The schema is sent once to
+    each worker, as a spec, and records are sent in chunks of chunk_size. At most
+    two chunks per worker are in flight and results are yielded in input order,
+    as (output, messages) pairs. Outputs must be picklable, so the profiler and
+    lazy options are rejected.
+    '''
+    for name in LOCAL_OPTIONS:
+        if options.get(name):
+            raise ValueError('The {} option is not supported by parallel binds'.format(name))
+
+    schema.get_validator(defaults)
+    workers = workers or cpu_count() or 1
+    chunks = iter_chunks(records, chunk_size)
+    pending = deque()
+
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(schema.to_spec(), defaults, options)) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(validate_chunk, chunk))
+
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
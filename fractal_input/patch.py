@@ -0,0 +1,130 @@
+from .constraint import ConstraintException, ConstraintErrors
+from .context import collect_error
+from .node import ListNode, ObjectNode
+
+
+def parse_paths(paths):
+    '''
+    Turns JSON pointers, or sequences of keys, into tuples of keys.
+    '''
+    return {
+        tuple(key.replace('~1', '/').replace('~0', '~') for key in path.split('/')[1:])
+        if isinstance(path, str) else tuple(path)
+        for path in paths
+    }
+
+
+def group_paths(paths):
+    groups = {}
+
+    for path in paths:
+        groups.setdefault(path[0], set()).add(path[1:])
+
+    return groups
+
+
+async def revalidate(node, previous, value, paths, budget=None, depth=1):
+    '''
+    Validates value against node reusing previous, the output of an earlier
+    validation, for every subtree outside paths. Containers along the changed
+    paths are rebuilt and get their constraints checked again. With a budget,
+    only the subtrees validated again are measured.
+    '''
+    if () in paths or previous is None:
+        return await resolve(node, value, budget, depth)
+
+    if isinstance(node, ListNode):
+        data = await revalidate_items(node, previous, value, paths, budget, depth)
+    elif node.has_fields() and node.unknown == 'ignore' and isinstance(value, dict):
+        data = await revalidate_children(node, previous, value, paths, budget, depth)
+    else:
+        data = None
+
+    if data is None:
+        return await resolve(node, value, budget, depth)
+
+    return await node.get_value(data)
+
+
+async def resolve(node, value, budget, depth):
+    if budget is not None:
+        budget.check(value, depth)
+
+    return await node.resolve(value)
+
+
+async def revalidate_children(node, previous, value, paths, budget, depth):
+    if isinstance(node, ObjectNode):
+        data = {
+            child.name: getattr(previous, child.name, None)
+            for child in node.children
+            if child.name in value or child.is_required or child.default is not None
+        }
+    elif isinstance(previous, dict):
+        data = dict(previous)
+    else:
+        return None
+
+    changes = group_paths(paths)
+    child_index = node.get_child_index()
+    errors = None
+
+    for name in sorted(changes, key=str):
+        child = child_index.get(name)
+
+        if child is None:
+            continue
+
+        if name in value:
+            child_value = value[name]
+        elif not child.is_required:
+            if child.default is None:
+                data.pop(name, None)
+                continue
+
+            child_value = child.default
+        else:
+            child_value = None
+
+        try:
+            data[name] = await revalidate(child, data.get(name), child_value, changes[name], budget, depth + 1)
+        except ConstraintException as e:
+            e.prepend_path(name)
+            errors = collect_error(e, errors)
+
+    if errors:
+        raise ConstraintErrors(errors)
+
+    return data
+
+
+async def revalidate_items(node, previous, values, paths, budget, depth):
+    if not isinstance(previous, list) or not isinstance(values, list) or len(previous) != len(values):
+        return None
+
+    changes = {}
+
+    for key, suffixes in group_paths(paths).items():
+        if isinstance(key, str) and key.isdigit():
+            key = int(key)
+
+        if not isinstance(key, int) or not 0 <= key < len(values):
+            return None
+
+        changes.setdefault(key, set()).update(suffixes)
+
+    item_node = node.get_inner_node()
+    result = list(previous)
+    errors = None
+
+    for index, suffixes in changes.items():
+        try:
+            result[index] = await revalidate(item_node, previous[index], values[index], suffixes, budget, depth + 1)
+        except ConstraintException as e:
+            e.prepend_path(index)
+            errors = collect_error(e, errors)
+
+    if errors:
+        raise ConstraintErrors(errors)
+
+    return result
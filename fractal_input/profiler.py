@@ -0,0 +1,106 @@
+from random import random
+from threading import Lock
+from time import perf_counter
+from .constraint import ConstraintException
+
+
+class NodeProfiler(object):
+    '''
+    Records, per node path, how many times a node was resolved, how many of those
+    failed and the time spent in the whole node, in its constraints and in its
+    transform. Binds that are not sampled keep using compiled validators and are
+    not measured at all.
+    '''
+
+    def __init__(self, sample_rate=1.0):
+        self.sample_rate = sample_rate
+        self.stats = {}
+        self.lock = Lock()
+
+    def should_sample(self):
+        return self.sample_rate >= 1 or random() < self.sample_rate
+
+    def get_stats(self, node):
+        path = node.path if node.path is not None else node.name
+        stats = self.stats.get(path)
+
+        if stats is None:
+            stats = self.stats.setdefault(path, [0, 0, 0.0, 0.0, 0.0])
+
+        return stats
+
+    async def profile(self, node, value, context):
+        start = perf_counter()
+        is_failure = False
+
+        try:
+            return await node.resolve_walk(value, context)
+        except ConstraintException:
+            is_failure = True
+            raise
+        finally:
+            elapsed = perf_counter() - start
+
+            with self.lock:
+                stats = self.get_stats(node)
+                stats[0] += 1
+                stats[1] += is_failure
+                stats[4] += elapsed
+
+    async def profile_value(self, node, value):
+        start = perf_counter()
+
+        try:
+            await node.check_constraints(value)
+        finally:
+            middle = perf_counter()
+
+            with self.lock:
+                self.get_stats(node)[2] += middle - start
+
+        try:
+            return await node.apply_transform(value)
+        finally:
+            elapsed = perf_counter() - middle
+
+            with self.lock:
+                self.get_stats(node)[3] += elapsed
+
+    def reset(self):
+        with self.lock:
+            self.stats = {}
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                path or '/': {
+                    'calls': calls,
+                    'failures': failures,
+                    'constraint_seconds': constraint_seconds,
+                    'transform_seconds': transform_seconds,
+                    'total_seconds': total_seconds,
+                }
+                for path, (calls, failures, constraint_seconds, transform_seconds, total_seconds) in self.stats.items()
+            }
+
+    def to_prometheus(self, prefix='fractal_input_node'):
+        metrics = [
+            ('calls_total', 'calls', 'Number of node validations'),
+            ('failures_total', 'failures', 'Number of failed node validations'),
+            ('constraint_seconds_total', 'constraint_seconds', 'Time spent in node constraints'),
+            ('transform_seconds_total', 'transform_seconds', 'Time spent in node transforms'),
+            ('seconds_total', 'total_seconds', 'Time spent in nodes, children included'),
+        ]
+        stats = self.to_dict()
+        lines = []
+
+        for suffix, key, description in metrics:
+            name = '{}_{}'.format(prefix, suffix)
+            lines.append('# HELP {} {}'.format(name, description))
+            lines.append('# TYPE {} counter'.format(name))
+
+            for path, values in stats.items():
+                label = path.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+                lines.append('{}{{path="{}"}} {}'.format(name, label, values[key]))
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,58 @@
+from collections import namedtuple
+
+
+class BindResult(namedtuple('BindResult', ('data', 'exceptions'))):
+    '''
+    Immutable outcome of a validation: the output data and the raised
+    constraint exceptions.
+    '''
+    __slots__ = ()
+
+    def __new__(cls, data, exceptions):
+        return super(BindResult, cls).__new__(cls, data, tuple(exceptions))
+
+    @property
+    def errors(self):
+        return [exception.message for exception in self.exceptions]
+
+    def is_valid(self):
+        return len(self.exceptions) == 0
+
+    def get_errors(self):
+        return [{'path': exception.get_pointer(), 'message': exception.message} for exception in self.exceptions]
+
+    def get_error_as_string(self):
+        if not self.exceptions:
+            return None
+
+        return ','.join(self.errors)
+
+
+class BatchResult(object):
+    __slots__ = ('outputs', 'errors')
+
+    def __init__(self):
+        self.outputs = []
+        self.errors = {}
+
+    def append(self, output, errors):
+        if errors:
+            self.errors[len(self.outputs)] = errors
+
+        self.outputs.append(output)
+
+    def __len__(self):
+        return len(self.outputs)
+
+    def __iter__(self):
+        for index, output in enumerate(self.outputs):
+            yield output, self.errors.get(index, [])
+
+    def get_errors(self, index):
+        return self.errors.get(index, [])
+
+    def count_valid(self):
+        return len(self.outputs) - len(self.errors)
+
+    def is_valid(self):
+        return len(self.errors) == 0
@@ -0,0 +1,210 @@
+import json
+from .constraint import ConstraintException, ConstraintErrors
+from .context import BindContext, bind_context
+from .spec import dump_spec, load_spec, get_spec_hash
+from .patch import parse_paths, revalidate
+from .lazy import check_required, create_proxy
+from .budget import Budget
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class AsyncSchemaException(Exception):
+    pass
+
+
+def run_sync(coroutine):
+    '''
+    Runs a coroutine over a synchronous node tree without an event loop, since
+    none of its nodes ever suspends.
+    '''
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+
+    coroutine.close()
+    raise AsyncSchemaException('Schema has asynchronous nodes or constraints, use bind() instead')
+
+
+class Schema(object):
+    def __init__(self, root_node, budget=None):
+        root_node.freeze()
+        self.root_node = root_node
+        self.budget = budget
+
+    @classmethod
+    def from_spec(cls, spec, type_handler=None, modules=None):
+        budget = Budget(**spec['budget']) if spec.get('budget') else None
+        return cls(load_spec(spec, type_handler, modules), budget)
+
+    def to_spec(self):
+        spec = dump_spec(self.root_node)
+
+        if self.budget is not None:
+            spec['budget'] = self.budget.to_dict()
+
+        return spec
+
+    def get_hash(self):
+        return get_spec_hash(self.to_spec())
+
+    def dump(self, data):
+        '''
+        Turns an output of this schema, or an object with the same shape, into
+        dicts, lists and JSON scalars, formatting datetimes with their formatter.
+        '''
+        return self.root_node.get_dumper()(data)
+
+    def dump_json(self, data):
+        value = self.dump(data)
+
+        if orjson is not None:
+            return orjson.dumps(value)
+
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def get_root(self, defaults=None):
+        if not defaults:
+            return self.root_node
+
+        root = self.root_node.copy()
+        root.children = [
+            child.with_default(defaults[child.name]) if child.name in defaults else child
+            for child in self.root_node.children
+        ]
+        return root
+
+    def is_sync(self):
+        return self.root_node.get_validator() is not None
+
+    def get_validator(self, defaults=None, trusted=False):
+        validator = self.get_root(defaults).get_validator(trusted)
+
+        if validator is None:
+            raise AsyncSchemaException('Schema has asynchronous nodes or constraints, use bind() instead')
+
+        return validator
+
+    def create_context(self, options):
+        context = BindContext(**options)
+
+        if context.budget is None:
+            context.budget = self.budget
+
+        if context.profiler is not None and not context.profiler.should_sample():
+            context.profiler = None
+
+        return context
+
+    async def validate(self, input_data, defaults=None, **options):
+        context = self.create_context(options)
+        token = bind_context.set(context)
+
+        try:
+            return await self.resolve(self.get_root(defaults), input_data, context.budget)
+        finally:
+            bind_context.reset(token)
+
+    def validate_sync(self, input_data, defaults=None, **options):
+        context = self.create_context(options)
+        validator = self.get_validator(defaults, context.trusted)
+        token = bind_context.set(context)
+
+        try:
+            if context.profiler is not None:
+                return run_sync(self.resolve(self.get_root(defaults), input_data, context.budget))
+
+            if context.lazy:
+                return self.resolve_lazy(self.get_root(defaults), input_data, context.budget)
+
+            return self.resolve_sync(validator, input_data, context.budget)
+        finally:
+            bind_context.reset(token)
+
+    async def revalidate(self, previous, input_data, paths, defaults=None, **options):
+        context = self.create_context(options)
+        token = bind_context.set(context)
+
+        try:
+            return await revalidate(self.get_root(defaults), previous, input_data, parse_paths(paths), context.budget), []
+        except ConstraintException as e:
+            return None, self.get_errors(e)
+        finally:
+            bind_context.reset(token)
+
+    def revalidate_sync(self, previous, input_data, paths, defaults=None, **options):
+        self.get_validator(defaults)
+
+        return run_sync(self.revalidate(previous, input_data, paths, defaults, **options))
+
+    async def iter_validate(self, records, defaults=None, **options):
+        root = self.get_root(defaults)
+
+        for input_data in records:
+            context = self.create_context(options)
+            token = bind_context.set(context)
+
+            try:
+                result = await self.resolve(root, input_data, context.budget)
+            finally:
+                bind_context.reset(token)
+
+            yield result
+
+    def iter_validate_sync(self, records, defaults=None, **options):
+        validator = self.get_validator(defaults, options.get('trusted', False))
+        root = self.get_root(defaults)
+
+        for input_data in records:
+            context = self.create_context(options)
+            token = bind_context.set(context)
+
+            try:
+                if context.profiler is not None:
+                    result = run_sync(self.resolve(root, input_data, context.budget))
+                elif context.lazy:
+                    result = self.resolve_lazy(root, input_data, context.budget)
+                else:
+                    result = self.resolve_sync(validator, input_data, context.budget)
+            finally:
+                bind_context.reset(token)
+
+            yield result
+
+    async def resolve(self, root, input_data, budget=None):
+        try:
+            if budget is not None:
+                budget.check(input_data)
+
+            return await root.resolve(input_data), []
+        except ConstraintException as e:
+            return None, self.get_errors(e)
+
+    def resolve_sync(self, validator, input_data, budget=None):
+        try:
+            if budget is not None:
+                budget.check(input_data)
+
+            return validator(input_data), []
+        except ConstraintException as e:
+            return None, self.get_errors(e)
+
+    def resolve_lazy(self, root, input_data, budget=None):
+        try:
+            if budget is not None:
+                budget.check(input_data)
+
+            check_required(root, input_data)
+            return create_proxy(root, input_data), []
+        except ConstraintException as e:
+            return None, self.get_errors(e)
+
+    def get_errors(self, exception):
+        if isinstance(exception, ConstraintErrors):
+            return exception.errors
+
+        return [exception]
@@ -0,0 +1,226 @@
+import json
+from hashlib import sha256
+from importlib import import_module
+from .cache import TransformCache
+from .constraint import (
+    RequiredConstraint, RangeConstraint, LengthConstraint, RegexConstraint, EnumConstraint, UniqueConstraint
+)
+from .hydrator import is_generated
+from .node import Node, ListNode, ObjectNode, DatetimeNode, UnionNode
+from .type_handler import TypeHandler
+
+
+SPEC_VERSION = 1
+
+CONSTRAINT_TYPES = {
+    RequiredConstraint: 'required',
+    RangeConstraint: 'range',
+    LengthConstraint: 'length',
+    RegexConstraint: 'regex',
+    EnumConstraint: 'enum',
+    UniqueConstraint: 'unique',
+}
+
+
+class SchemaSpecException(Exception):
+    pass
+
+
+def dump_spec(root_node):
+    '''
+    Describes a node tree with JSON compatible values only. Custom node classes
+    are referenced by import path and must be constructible the same way as the
+    built-in node they extend; custom constraints and cache key functions cannot
+    be described.
+    '''
+    return {'version': SPEC_VERSION, 'root': dump_node(root_node, get_type_names())}
+
+
+def load_spec(spec, type_handler=None, modules=None):
+    '''
+    Builds the node tree described by spec. When modules is given, custom node
+    and object classes are only imported from those modules.
+    '''
+    if spec.get('version') != SPEC_VERSION:
+        raise SchemaSpecException('Unsupported schema spec version: {}'.format(spec.get('version')))
+
+    return load_node(spec['root'], type_handler or TypeHandler(), get_type_classes(), modules)
+
+
+def get_spec_hash(spec):
+    return sha256(json.dumps(spec, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def get_type_names():
+    type_names = {node_class: name for name, node_class in TypeHandler().type_map.items()}
+    type_names[ListNode] = 'list'
+    type_names[DatetimeNode] = 'datetime'
+    return type_names
+
+
+def get_type_classes():
+    return {name: node_class for node_class, name in get_type_names().items()}
+
+
+def get_class_path(value_class):
+    if '<locals>' in value_class.__qualname__:
+        raise SchemaSpecException('Class {} is not importable'.format(value_class.__qualname__))
+
+    return '{}:{}'.format(value_class.__module__, value_class.__qualname__)
+
+
+def import_class(path, modules=None):
+    module_name, separator, qualname = path.partition(':')
+
+    if not separator:
+        raise SchemaSpecException('Invalid class path: {}'.format(path))
+
+    if modules is not None and module_name not in modules:
+        raise SchemaSpecException('Module {} is not allowed'.format(module_name))
+
+    value = import_module(module_name)
+
+    for name in qualname.split('.'):
+        value = getattr(value, name)
+
+    return value
+
+
+def dump_node(node, type_names):
+    node_class = type(node)
+    spec = {
+        'type': type_names.get(node_class) or get_class_path(node_class),
+        'name': node.name,
+        'required': node.is_required,
+        'constraints': [dump_constraint(constraint) for constraint in node.constraints],
+    }
+
+    if node.default is not None:
+        spec['default'] = node.default
+
+    if node.cache is not None:
+        spec['cache'] = dump_cache(node.cache)
+
+    if node.unknown != 'ignore':
+        spec['unknown'] = node.unknown
+
+    if node.children:
+        spec['children'] = [dump_node(child, type_names) for child in node.children]
+
+    if isinstance(node, ObjectNode) and node.object_class is not None and not is_generated(node.object_class):
+        spec['class'] = get_class_path(node.object_class)
+
+    if isinstance(node, ListNode):
+        spec['items'] = dump_node(node.get_inner_node(), type_names)
+        spec['array'] = node.as_array
+
+    if isinstance(node, DatetimeNode):
+        spec['formatter'] = node.formatter
+        spec['cache_size'] = node.cache_size
+
+    if isinstance(node, UnionNode):
+        spec['discriminator'] = node.discriminator
+
+    return spec
+
+
+def dump_constraint(constraint):
+    constraint_type = CONSTRAINT_TYPES.get(type(constraint))
+
+    if constraint_type is None:
+        raise SchemaSpecException('Constraint {} cannot be exported'.format(type(constraint).__qualname__))
+
+    spec = {'type': constraint_type, 'message': constraint.message}
+
+    if isinstance(constraint, RangeConstraint):
+        spec['min'] = constraint.min
+        spec['max'] = constraint.max
+    elif isinstance(constraint, RegexConstraint):
+        spec['pattern'] = constraint.regex.pattern
+        spec['flags'] = int(constraint.regex.flags)
+    elif isinstance(constraint, EnumConstraint):
+        spec['values'] = sorted(constraint.values, key=lambda value: (type(value).__name__, repr(value)))
+
+    return spec
+
+
+def dump_cache(cache):
+    if cache.key is not None:
+        raise SchemaSpecException('Caches with a key function cannot be exported')
+
+    return {'maxsize': cache.maxsize, 'ttl': cache.ttl}
+
+
+def load_node(spec, type_handler, type_classes, modules):
+    node_type = spec['type']
+    node_class = type_classes.get(node_type) or import_class(node_type, modules)
+
+    if not isinstance(node_class, type) or not issubclass(node_class, Node):
+        raise SchemaSpecException('Invalid node type: {}'.format(node_type))
+
+    if issubclass(node_class, ListNode):
+        node = node_class(load_node(spec['items'], type_handler, type_classes, modules))
+        node.as_array = spec.get('array', False)
+    elif issubclass(node_class, DatetimeNode):
+        node = node_class(spec.get('formatter'), spec.get('cache_size', 0))
+    elif issubclass(node_class, UnionNode):
+        node = node_class(spec.get('discriminator'))
+    elif issubclass(node_class, ObjectNode):
+        node = node_class(load_object_class(spec['class'], modules) if 'class' in spec else None)
+    else:
+        node = node_class()
+
+    node.type_handler = type_handler
+    node.name = spec['name']
+    node.is_required = spec.get('required', True)
+    node.constraints = [load_constraint(constraint) for constraint in spec.get('constraints', [])]
+    node.default = spec.get('default')
+
+    if 'unknown' in spec:
+        node.set_unknown(spec['unknown'])
+
+    if spec.get('cache') is not None:
+        node.cache = TransformCache(**spec['cache'])
+
+    node.children = [load_node(child, type_handler, type_classes, modules) for child in spec.get('children', [])]
+
+    if isinstance(node, UnionNode):
+        node.candidates = list(node.children)
+
+    return node
+
+
+def load_object_class(path, modules):
+    object_class = import_class(path, modules)
+
+    if not isinstance(object_class, type):
+        raise SchemaSpecException('Invalid object class: {}'.format(path))
+
+    return object_class
+
+
+def load_constraint(spec):
+    constraint_type = spec['type']
+    message = spec.get('message')
+
+    if constraint_type == 'required':
+        constraint = RequiredConstraint()
+        constraint.message = message or constraint.message
+        return constraint
+
+    if constraint_type == 'range':
+        return RangeConstraint(spec.get('min'), spec.get('max'), message)
+
+    if constraint_type == 'length':
+        return LengthConstraint(spec.get('min'), spec.get('max'), message)
+
+    if constraint_type == 'regex':
+        return RegexConstraint(spec['pattern'], spec.get('flags', 0), message)
+
+    if constraint_type == 'enum':
+        return EnumConstraint(spec['values'], message)
+
+    if constraint_type == 'unique':
+        return UniqueConstraint(message)
+
+    raise SchemaSpecException('Invalid constraint type: {}'.format(constraint_type))
@@ -0,0 +1,90 @@
+import json
+import os
+from hashlib import sha256
+from inspect import getsource
+from .input_handler import InputHandler
+from .schema import Schema
+from .spec import SchemaSpecException, get_spec_hash
+from .version import __version__
+
+
+class SchemaStore(object):
+    '''
+    Keeps the specs of InputHandler schemas in a directory, so processes can
+    load them at startup instead of running every define() method. Files written
+    by another version of the library, or for another version of the handler
+    source, are ignored. Custom classes are only imported from the module of the
+    handler and from modules.
+    '''
+
+    def __init__(self, directory, modules=()):
+        self.directory = directory
+        self.modules = frozenset(modules)
+
+    def get_path(self, handler_class):
+        return os.path.join(self.directory, '{}.{}.json'.format(handler_class.__module__, handler_class.__qualname__))
+
+    def get_fingerprint(self, handler_class):
+        '''
+        Hashes the source of the handler class and of its InputHandler bases, or
+        returns None when the source is not available.
+        '''
+        digest = sha256()
+
+        try:
+            for base in handler_class.__mro__:
+                if issubclass(base, InputHandler) and base is not InputHandler:
+                    digest.update(getsource(base).encode('utf-8'))
+        except (OSError, TypeError):
+            return None
+
+        return digest.hexdigest()
+
+    def save(self, handler_class):
+        spec = handler_class().get_schema().to_spec()
+        path = self.get_path(handler_class)
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        with open(temporary_path, 'w') as spec_file:
+            json.dump({
+                'version': __version__,
+                'fingerprint': self.get_fingerprint(handler_class),
+                'hash': get_spec_hash(spec),
+                'spec': spec,
+            }, spec_file, sort_keys=True)
+
+        os.replace(temporary_path, path)
+
+    def load(self, handler_class):
+        try:
+            with open(self.get_path(handler_class)) as spec_file:
+                content = json.load(spec_file)
+        except (OSError, ValueError):
+            return False
+
+        fingerprint = self.get_fingerprint(handler_class)
+
+        if fingerprint is None or content.get('fingerprint') != fingerprint:
+            return False
+
+        if content.get('version') != __version__ or content.get('hash') != get_spec_hash(content.get('spec')):
+            return False
+
+        try:
+            schema = Schema.from_spec(content['spec'], modules=self.modules | {handler_class.__module__})
+        except SchemaSpecException:
+            return False
+
+        InputHandler.schemas[handler_class] = schema
+        return True
+
+    def warm_start(self, handler_classes):
+        '''
+        Loads the stored schema of each handler class, defining and storing the
+        ones that are missing or stale.
+        '''
+        for handler_class in handler_classes:
+            if not self.load(handler_class):
+                self.save(handler_class)
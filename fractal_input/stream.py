@@ -0,0 +1,207 @@
+import json
+from codecs import getincrementaldecoder
+from io import BytesIO, StringIO
+from .node import ListNode
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+
+CHUNK_SIZE = 65536
+WHITESPACE = ' \t\n\r'
+SEPARATORS = WHITESPACE + ',]'
+CONTAINER_EVENTS = ('start_map', 'start_array')
+
+
+def load_json(source, node=None):
+    '''
+    Parses a JSON document from bytes, str or a file-like object. When ijson is
+    installed, keys that are not declared by the node tree are skipped while
+    parsing instead of being built and discarded by the walk.
+    '''
+    if ijson is None:
+        return json.loads(source.read() if hasattr(source, 'read') else source)
+
+    events = ijson.parse(get_binary_file(source), use_float=True)
+    prefix, event, value = next(events)
+    return build_value(events, event, value, node)
+
+
+def iter_json_items(source, prefix='', node=None, chunk_size=CHUNK_SIZE):
+    '''
+    Yields the items of the JSON array found at prefix (dot separated keys, the
+    document itself when empty) while the source is read, so memory is bounded
+    by the largest item rather than by the whole payload.
+    '''
+    if ijson is not None:
+        return iter_ijson_items(source, prefix, node)
+
+    if not prefix:
+        return iter_array_items(get_reader(source), chunk_size)
+
+    value = load_json(source, node)
+
+    for key in prefix.split('.'):
+        value = value[key]
+
+    return iter(value)
+
+
+def iter_ijson_items(source, prefix, node):
+    item_prefix = prefix + '.item' if prefix else 'item'
+    events = ijson.parse(get_binary_file(source), use_float=True)
+
+    for event_prefix, event, value in events:
+        if event_prefix == item_prefix and event not in ('map_key', 'end_map', 'end_array'):
+            yield build_value(events, event, value, node)
+
+
+def iter_array_items(read, chunk_size=CHUNK_SIZE):
+    decoder = json.JSONDecoder()
+    buffer = ''
+    index = 0
+    is_eof = False
+    expected = '['
+
+    while True:
+        while index < len(buffer) and buffer[index] in WHITESPACE:
+            index += 1
+
+        if index == len(buffer):
+            if is_eof:
+                raise ValueError('Unexpected end of JSON array')
+
+            chunk = read(chunk_size)
+            is_eof = not chunk
+            buffer, index = buffer[index:] + chunk, 0
+            continue
+
+        char = buffer[index]
+
+        if expected == '[':
+            if char != '[':
+                raise ValueError('Expected a JSON array, got {!r}'.format(char))
+
+            index += 1
+            expected = 'first'
+        elif expected in ('first', 'item'):
+            if expected == 'first' and char == ']':
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                if is_eof:
+                    raise
+
+                end = None
+
+            if end is None or (not is_eof and (end == len(buffer) or buffer[end] not in SEPARATORS)):
+                chunk = read(max(chunk_size, len(buffer) - index))
+                is_eof = not chunk
+                buffer, index = buffer[index:] + chunk, 0
+                continue
+
+            yield item
+            index = end
+            expected = ','
+        elif char == ',':
+            index += 1
+            expected = 'item'
+        elif char == ']':
+            return
+        else:
+            raise ValueError('Expected , or ] in JSON array, got {!r}'.format(char))
+
+
+def build_value(events, event, value, node):
+    if event == 'start_map':
+        children = get_children(node)
+        result = {}
+
+        for prefix, event, value in events:
+            if event == 'end_map':
+                return result
+
+            key = value
+            prefix, event, value = next(events)
+
+            if children is None:
+                child = None
+            elif key in children:
+                child = children[key]
+            else:
+                skip_value(events, event)
+                continue
+
+            result[key] = build_value(events, event, value, child)
+
+    if event == 'start_array':
+        inner_node = node.get_inner_node() if isinstance(node, ListNode) else None
+        result = []
+
+        for prefix, event, value in events:
+            if event == 'end_array':
+                return result
+
+            result.append(build_value(events, event, value, inner_node))
+
+    return value
+
+
+def skip_value(events, event):
+    if event not in CONTAINER_EVENTS:
+        return
+
+    depth = 1
+
+    for prefix, event, value in events:
+        if event in CONTAINER_EVENTS:
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+
+            if depth == 0:
+                return
+
+
+def get_children(node):
+    if node is None or not node.has_fields() or node.unknown != 'ignore':
+        return None
+
+    return node.get_child_index()
+
+
+def get_binary_file(source):
+    if isinstance(source, (bytes, bytearray)):
+        return BytesIO(source)
+
+    if isinstance(source, str):
+        return BytesIO(source.encode('utf-8'))
+
+    return source
+
+
+def get_reader(source):
+    if isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+    elif isinstance(source, str):
+        source = StringIO(source)
+
+    decoder = getincrementaldecoder('utf-8')()
+
+    def read(size):
+        while True:
+            chunk = source.read(size)
+
+            if not isinstance(chunk, (bytes, bytearray)):
+                return chunk
+
+            text = decoder.decode(chunk, final=not chunk)
+
+            if text or not chunk:
+                return text
+
+    return read
@@ -1,4 +1,4 @@
-from .node import Node, ObjectNode, StringNode, IntegerNode, FloatNode, BooleanNode, EmailNode
+from .node import Node, ObjectNode, StringNode, IntegerNode, FloatNode, BooleanNode, EmailNode, UnionNode
 
 
 class InvalidTypeException(Exception):
@@ -14,6 +14,8 @@ class TypeHandler(object):
             'boolean': BooleanNode,
             'email': EmailNode,
             'dict': Node,
+            'object': ObjectNode,
+            'union': UnionNode,
         }
 
     def create_node(self, node_type):
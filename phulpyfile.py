@@ -16,6 +16,13 @@ def lint(phulpy):
         raise Exception('lint test failed')
 
 
+@task
+def benchmark(phulpy):
+    result = system('python -m benchmark')
+    if result:
+        raise Exception('Benchmark regression')
+
+
 @task
 def unit_test(phulpy):
     result = system(
@@ -9,6 +9,11 @@ setup(
     packages=['fractal_input'],
     setup_requires=['wheel'],
     install_requires=[],
+    extras_require={
+        'json': ['orjson'],
+        'numpy': ['numpy'],
+        'stream': ['ijson'],
+    },
     entry_points={
         "console_scripts": [
             "fractal_input = fractal_input.__main__:__main__"
@@ -0,0 +1,15 @@
+from fractal_input.node import StringNode
+
+
+class EchoNode(StringNode):
+    '''
+    String node with a coroutine transform, forcing the asynchronous walk.
+    '''
+
+    async def transform(self, value):
+        return value
+
+
+class UpperNode(StringNode):
+    async def transform(self, value):
+        return value.upper() if value else value
@@ -0,0 +1,15 @@
+from benchmark.runner import run, compare
+from benchmark.scenarios import SCENARIOS
+
+
+class TestBenchmark(object):
+    def test_run_and_compare(self):
+        results = run(SCENARIOS, duration=0, min_iterations=2, selected=['flat', 'failing'])
+
+        assert ['flat:async', 'flat:sync', 'failing:async', 'failing:sync'] == list(results)
+        assert {'ops', 'p50_us', 'p95_us', 'p99_us', 'peak_traced_bytes'} == set(results['flat:sync'])
+
+        baseline = {'flat:sync': {'ops': results['flat:sync']['ops'] * 2}}
+
+        assert ['flat:sync'] == compare(results, baseline, 0.2)
+        assert [] == compare(results, baseline, 0.6)
@@ -0,0 +1,56 @@
+import pytest
+from fractal_input import InputHandler
+from .nodes import UpperNode
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('name', 'string')
+        self.add('age', 'integer', {'required': False})
+
+
+class TestBindMany(object):
+    @pytest.mark.asyncio
+    async def test_bind_many(self):
+        handler = DataHandler()
+        result = await handler.bind_many([{'name': 'a', 'age': '1'}, {'age': 2}, {'name': 'c'}])
+
+        assert 3 == len(result)
+        assert not result.is_valid()
+        assert 2 == result.count_valid()
+        assert [{'name': 'a', 'age': 1}, None, {'name': 'c'}] == result.outputs
+        assert {1: ['name is required']} == result.errors
+        assert ['name is required'] == result.get_errors(1)
+        assert [] == result.get_errors(0)
+        assert handler.get_data() is None
+
+    def test_bind_many_sync(self):
+        result = DataHandler().bind_many_sync(iter([{'name': 'a'}, {'name': 'b'}]))
+
+        assert result.is_valid()
+        assert [({'name': 'a'}, []), ({'name': 'b'}, [])] == list(result)
+
+    def test_iter_bind_sync_is_lazy(self):
+        def records():
+            for index in range(3):
+                yield {'name': index}
+
+            raise AssertionError('records should not be consumed')
+
+        results = DataHandler().iter_bind_sync(records())
+
+        assert ({'name': '0'}, []) == next(results)
+        assert ({'name': '1'}, []) == next(results)
+
+    @pytest.mark.asyncio
+    async def test_iter_bind_with_async_nodes(self):
+        class AsyncHandler(InputHandler):
+            def define(self):
+                self.add('name', UpperNode())
+
+        outputs = []
+
+        async for output, errors in AsyncHandler().iter_bind([{'name': 'a'}, {'name': 'b'}]):
+            outputs.append(output)
+
+        assert [{'name': 'A'}, {'name': 'B'}] == outputs
@@ -0,0 +1,68 @@
+import pytest
+from fractal_input import InputHandler, ListNode
+from fractal_input.constraint import Constraint
+from fractal_input.schema import AsyncSchemaException
+from .nodes import UpperNode
+
+
+class Telephone(object):
+    number = None
+
+
+class AvailableConstraint(Constraint):
+    def __init__(self):
+        self.message = r'{field} is taken'
+
+    async def validate(self, value):
+        return value != 'taken'
+
+
+class TestBindSync(object):
+    def test_bind_sync(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('name', 'string')
+                self.add('age', 'integer', {'required': False})
+                telephones = self.add('telephones', ListNode(Telephone))
+                telephones.add('number', 'string')
+
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'telephones': [{'number': 1}]})
+
+        assert handler.is_valid()
+        assert handler.get_schema().is_sync()
+        assert 'Rick' == handler.get_data()['name']
+        assert '1' == handler.get_data()['telephones'][0].number
+
+        handler.bind_sync({'telephones': []})
+
+        assert 'name is required' == handler.get_error_as_string()
+
+    def test_bind_sync_rejects_async_nodes(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('name', UpperNode())
+
+        handler = DataHandler()
+
+        assert not handler.get_schema().is_sync()
+
+        with pytest.raises(AsyncSchemaException):
+            handler.bind_sync({'name': 'rick'})
+
+    @pytest.mark.asyncio
+    async def test_async_constraints(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('username', 'string', {'constraints': [AvailableConstraint()]})
+                self.add('age', 'integer')
+
+        handler = DataHandler()
+
+        assert not handler.get_schema().is_sync()
+
+        await handler.bind({'username': 'taken', 'age': 1})
+        assert 'username is taken' == handler.get_error_as_string()
+
+        await handler.bind({'username': 'rick', 'age': '1'})
+        assert {'username': 'rick', 'age': 1} == handler.get_data()
@@ -0,0 +1,88 @@
+import time
+import pytest
+from fractal_input import Budget, InputHandler, ListNode, Schema
+from fractal_input.budget import BudgetExceededException
+
+
+class DataHandler(InputHandler):
+    budget = Budget(max_depth=4, max_items=100, max_string_length=50, max_values=1000)
+
+    def define(self):
+        self.add('name', 'string')
+        self.add('tags', ListNode('string'), {'required': False})
+        self.add('meta', 'dict', {'required': False})
+        self.add('matrix', ListNode(ListNode('integer')), {'required': False})
+
+
+class TestBudget(object):
+    def test_valid(self):
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'tags': ['a'] * 100, 'matrix': [[1, 2], [3]]})
+
+        assert handler.is_valid()
+
+    @pytest.mark.parametrize('payload,error', [
+        ({'name': 'Rick', 'tags': ['a'] * 101}, {'path': '/tags', 'message': 'List has more than 100 items'}),
+        ({'name': 'a' * 51}, {'path': '/name', 'message': 'String is longer than 50 characters'}),
+        ({'name': 'Rick', 'matrix': [[1], [2, 'a' * 51]]}, {'path': '/matrix/1/1', 'message': 'String is longer than 50 characters'}),
+        ({'name': 'Rick', 'meta': {'a': {'b': {'c': {}}}}}, {'path': '/meta/a/b/c', 'message': 'Input is nested deeper than 4 levels'}),
+        ({'name': 'Rick', 'k' * 51: 1}, {'path': '', 'message': 'Key is longer than 50 characters'}),
+        ({'name': 'Rick', 'matrix': [[1] * 100] * 10}, {'path': '/matrix/0', 'message': 'Input has more than 1000 values'}),
+    ])
+    def test_exceeded(self, payload, error):
+        handler = DataHandler()
+        handler.bind_sync(payload)
+
+        assert [error] == handler.get_errors()
+        assert isinstance(handler.exceptions[0], BudgetExceededException)
+
+    def test_bind_option(self):
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'tags': ['a', 'b']}, budget=Budget(max_items=1))
+
+        assert ['List has more than 1 items'] == handler.errors
+
+    @pytest.mark.asyncio
+    async def test_bind(self):
+        handler = DataHandler()
+        await handler.bind({'name': 'Rick', 'tags': ['a'] * 1000000})
+
+        assert ['List has more than 100 items'] == handler.errors
+
+    def test_deep_payload_is_rejected_early(self):
+        payload = {}
+        value = payload
+
+        for index in range(100000):
+            value['meta'] = {}
+            value = value['meta']
+
+        started_at = time.perf_counter()
+
+        handler = DataHandler()
+        handler.bind_sync(payload)
+
+        assert ['Input is nested deeper than 4 levels'] == handler.errors
+        assert time.perf_counter() - started_at < 0.1
+
+    def test_rebind_measures_changed_subtrees(self):
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'tags': ['a', 'b']})
+        handler.rebind_sync({'name': 'Morty', 'tags': ['a', 'b']}, ['/name'], budget=Budget(max_items=1))
+
+        assert handler.is_valid()
+        assert 'Morty' == handler.get_data()['name']
+
+        handler.rebind_sync({'name': 'Morty', 'tags': ['a', 'b', 'c']}, ['/tags'], budget=Budget(max_items=2))
+
+        assert [{'path': '/tags', 'message': 'List has more than 2 items'}] == handler.get_errors()
+
+        handler.bind_sync({'name': 'Rick', 'meta': {}})
+        handler.rebind_sync({'name': 'Rick', 'meta': {'a': {'b': {'c': {}}}}}, ['/meta'])
+
+        assert [{'path': '/meta/a/b/c', 'message': 'Input is nested deeper than 4 levels'}] == handler.get_errors()
+
+    def test_spec(self):
+        schema = Schema.from_spec(DataHandler().get_schema().to_spec())
+
+        assert DataHandler.budget.to_dict() == schema.budget.to_dict()
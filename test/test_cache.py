@@ -0,0 +1,144 @@
+import asyncio
+import pytest
+from fractal_input import InputHandler, ListNode, TransformCache
+from fractal_input.constraint import ConstraintException
+from fractal_input.node import StringNode
+
+
+class CountryNode(StringNode):
+    calls = []
+
+    async def transform(self, value):
+        CountryNode.calls.append(value)
+        await asyncio.sleep(0.001)
+
+        if value == 'xx':
+            raise ConstraintException('Invalid country: {}'.format(value))
+
+        return value.upper()
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCache(object):
+    def setup_method(self):
+        CountryNode.calls = []
+
+    @pytest.mark.asyncio
+    async def test_repeated_values_are_cached(self):
+        cache = TransformCache()
+
+        class DataHandler(InputHandler):
+            def define(self):
+                items = self.add('items', ListNode('dict'))
+                items.add('country', CountryNode(), {'cache': cache})
+
+        handler = DataHandler()
+        await handler.bind({'items': [{'country': 'br'}, {'country': 'us'}, {'country': 'br'}]})
+        await handler.bind({'items': [{'country': 'us'}]})
+
+        assert [{'country': 'US'}] == handler.get_data()['items']
+        assert ['br', 'us'] == CountryNode.calls
+        assert {'hits': 2, 'misses': 2, 'size': 2} == cache.get_stats()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_coalesced(self):
+        cache = TransformCache()
+
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('countries', ListNode('dict')).add('code', CountryNode(), {'cache': cache})
+
+        handler = DataHandler()
+        await handler.bind({'countries': [{'code': 'br'}] * 5}, concurrency=5)
+
+        assert handler.is_valid()
+        assert ['br'] == CountryNode.calls
+        assert {'hits': 4, 'misses': 1, 'size': 1} == cache.get_stats()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('country', CountryNode(), {'cache': {'maxsize': 10}})
+
+        handler = DataHandler()
+        await handler.bind({'country': 'xx'})
+        await handler.bind({'country': 'xx'})
+
+        assert 'Invalid country: xx' == handler.get_error_as_string()
+        assert ['xx', 'xx'] == CountryNode.calls
+
+    @pytest.mark.asyncio
+    async def test_shared_errors_keep_their_own_path(self):
+        cache = TransformCache()
+
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('a', CountryNode(), {'cache': cache})
+                self.add('b', CountryNode(), {'cache': cache})
+
+        handler = DataHandler()
+        await handler.bind({'a': 'xx', 'b': 'xx'}, collect_errors=True, concurrency=2)
+
+        assert ['xx'] == CountryNode.calls
+        assert ['/a', '/b'] == sorted(error.get_pointer() for error in handler.exceptions)
+
+    def test_values_of_different_types_are_cached_apart(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('value', 'string', {'cache': True})
+
+        handler = DataHandler()
+        handler.bind_sync({'value': 1})
+        handler.bind_sync({'value': True})
+
+        assert {'value': 'True'} == handler.get_data()
+
+    def test_lru_and_ttl(self):
+        clock = FakeClock()
+        cache = TransformCache(maxsize=2, ttl=10, clock=clock)
+
+        assert 'A' == cache.get_sync('a', str.upper)
+        assert 'B' == cache.get_sync('b', str.upper)
+        assert 'A' == cache.get_sync('a', str.upper)
+        assert 'C' == cache.get_sync('c', str.upper)
+        assert [(str, 'a'), (str, 'c')] == list(cache.entries)
+
+        clock.now = 10
+        cache.get_sync('a', str.upper)
+
+        assert {'hits': 1, 'misses': 4, 'size': 2} == cache.get_stats()
+
+    def test_key_function(self):
+        cache = TransformCache(key=lambda value: value.lower())
+
+        assert 'BR' == cache.get_sync('BR', str.upper)
+        assert 'BR' == cache.get_sync('br', str.upper)
+        assert {'hits': 1, 'misses': 1, 'size': 1} == cache.get_stats()
+
+    def test_unhashable_values_bypass_cache(self):
+        cache = TransformCache()
+
+        assert {'k': 1} == cache.get_sync({'k': 1}, dict)
+        assert {'hits': 0, 'misses': 0, 'size': 0} == cache.get_stats()
+
+    def test_compiled_nodes_use_cache(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('email', 'email', {'cache': True})
+
+        handler = DataHandler()
+        handler.bind_sync({'email': 'A@B.com'})
+        handler.bind_sync({'email': 'A@B.com'})
+
+        cache = handler.get_schema().root_node.children[0].cache
+
+        assert {'email': 'a@b.com'} == handler.get_data()
+        assert {'hits': 1, 'misses': 1, 'size': 1} == cache.get_stats()
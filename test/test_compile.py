@@ -0,0 +1,120 @@
+import pytest
+from fractal_input import InputHandler, ListNode, DatetimeNode
+from fractal_input.node import Node, StringNode
+from fractal_input.constraint import ConstraintException
+
+
+class User(object):
+    name = None
+    email = None
+    age = None
+    created = None
+    telephones = None
+
+
+class Telephone(object):
+    number = None
+
+
+class UserHandler(InputHandler):
+    def define(self):
+        user = self.add('user', User)
+        user.add('name', 'string')
+        user.add('email', 'email')
+        user.add('age', 'integer', {'required': False})
+        user.add('created', DatetimeNode('%Y-%m-%d'), {'required': False})
+        user.add('scores', ListNode('float'), {'required': False})
+        telephones = user.add('telephones', ListNode(Telephone), {'required': False})
+        telephones.add('number', 'string')
+        self.add('extra', 'dict', {'required': False})
+
+
+class UpperNode(StringNode):
+    async def transform(self, value):
+        value = await super(UpperNode, self).transform(value)
+        return value.upper() if value else value
+
+
+async def walk(node, value):
+    try:
+        return await node.get_value(await node.walk(value)), None
+    except ConstraintException as e:
+        return None, e.message
+
+
+def run(validator, value):
+    try:
+        return validator(value), None
+    except ConstraintException as e:
+        return None, e.message
+
+
+def as_dict(value):
+    if isinstance(value, list):
+        return [as_dict(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: as_dict(item) for key, item in value.items()}
+
+    if hasattr(value, '__dict__') and not isinstance(value, type):
+        return {key: as_dict(item) for key, item in vars(value).items()}
+
+    return value
+
+
+class TestCompile(object):
+    @pytest.mark.asyncio
+    async def test_compiled_validator_matches_walk(self):
+        root = UserHandler().get_schema().root_node
+        validator = root.get_validator()
+
+        payloads = [
+            {},
+            {'user': None},
+            {'user': 1},
+            {'user': {'name': 'Rick'}},
+            {'user': {'name': 'Rick', 'email': 'not an email'}},
+            {'user': {'name': 'Rick', 'email': 'RICK@rick.com', 'age': '3', 'created': '2020-01-02'}},
+            {'user': {'name': 'Rick', 'email': 'rick@rick.com', 'created': 'lala'}},
+            {'user': {'name': 'Rick', 'email': 'rick@rick.com', 'scores': [1, '2.5'], 'telephones': [{'number': 1}]}},
+            {'user': {'name': 'Rick', 'email': 'rick@rick.com', 'telephones': [{}]}},
+            {'user': {'name': 'Rick', 'email': 'rick@rick.com', 'telephones': 1}, 'extra': {'a': 1}},
+        ]
+
+        assert validator is not None
+
+        for payload in payloads:
+            walked_output, walked_error = await walk(root, payload)
+            compiled_output, compiled_error = run(validator, payload)
+
+            assert walked_error == compiled_error
+            assert as_dict(walked_output) == as_dict(compiled_output)
+
+    def test_async_transform_is_not_compiled(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('name', UpperNode())
+                self.add('age', 'integer')
+
+        root = DataHandler().get_schema().root_node
+
+        assert root.children[0].get_validator() is None
+        assert root.children[1].get_validator() is not None
+        assert root.get_validator() is None
+
+    @pytest.mark.asyncio
+    async def test_bind_with_async_transform(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('name', UpperNode())
+
+        handler = DataHandler()
+        await handler.bind({'name': 'rick'})
+
+        assert {'name': 'RICK'} == handler.get_data()
+
+    def test_unfrozen_node_is_not_cached(self):
+        node = Node()
+
+        assert node.get_validator() is not None
+        assert {} == node.validators
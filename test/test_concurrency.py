@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from fractal_input import InputHandler, ListNode, NodeProfiler
+from fractal_input.node import StringNode
+
+
+class LookupNode(StringNode):
+    running = 0
+    peak = 0
+
+    async def transform(self, value):
+        LookupNode.running += 1
+        LookupNode.peak = max(LookupNode.peak, LookupNode.running)
+        await asyncio.sleep(0.01 if value != 'slow' else 0.03)
+        LookupNode.running -= 1
+
+        if value == 'missing':
+            return None
+
+        return value.upper()
+
+
+class LookupHandler(InputHandler):
+    def define(self):
+        self.add('first', LookupNode())
+        self.add('second', LookupNode())
+        self.add('age', 'integer')
+        self.add('codes', ListNode(LookupNode()))
+
+
+class TestConcurrency(object):
+    def setup_method(self):
+        LookupNode.peak = 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_by_default(self):
+        handler = LookupHandler()
+        await handler.bind({'first': 'a', 'second': 'b', 'age': 1, 'codes': ['c', 'd']})
+
+        assert handler.is_valid()
+        assert 1 == LookupNode.peak
+
+    @pytest.mark.asyncio
+    async def test_concurrent_results_keep_order(self):
+        handler = LookupHandler()
+        await handler.bind({'first': 'slow', 'second': 'b', 'age': '1', 'codes': ['slow', 'd', 'e']}, concurrency=10)
+
+        assert handler.is_valid()
+        assert {'first': 'SLOW', 'second': 'B', 'age': 1, 'codes': ['SLOW', 'D', 'E']} == handler.get_data()
+        assert 5 == LookupNode.peak
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        handler = LookupHandler()
+        await handler.bind({'first': 'a', 'second': 'b', 'age': 1, 'codes': ['c'] * 10}, concurrency=2)
+
+        assert handler.is_valid()
+        assert 2 == LookupNode.peak
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_with_profiler(self):
+        handler = LookupHandler()
+        await handler.bind({'first': 'a', 'second': 'b', 'age': 1, 'codes': ['c'] * 10}, concurrency=2, profiler=NodeProfiler())
+
+        assert handler.is_valid()
+        assert 2 == LookupNode.peak
+
+    @pytest.mark.asyncio
+    async def test_concurrent_errors_keep_order(self):
+        class RequiredLookupHandler(InputHandler):
+            def define(self):
+                self.add('codes', ListNode(LookupNode()))
+                items = self.add('items', ListNode('dict'))
+                items.add('code', LookupNode())
+
+        handler = RequiredLookupHandler()
+        await handler.bind({'codes': [], 'items': [{'code': 'slow'}, {}, {}]}, concurrency=5, collect_errors=True)
+
+        assert ['/items/1/code', '/items/2/code'] == [error['path'] for error in handler.get_errors()]
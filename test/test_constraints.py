@@ -0,0 +1,111 @@
+import pytest
+from fractal_input import InputHandler, ListNode
+from fractal_input.constraint import (
+    DeclarativeConstraint, EnumConstraint, LengthConstraint, RangeConstraint, RegexConstraint, UniqueConstraint
+)
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('age', 'integer', {'required': False, 'constraints': [RangeConstraint(0, 150)]})
+        self.add('name', 'string', {'required': False, 'constraints': [LengthConstraint(min=2)]})
+        self.add('code', 'string', {'required': False, 'constraints': [RegexConstraint(r'[A-Z]{3}')]})
+        self.add('role', 'string', {'required': False, 'constraints': [EnumConstraint(['admin', 'user'])]})
+        self.add('scores', ListNode('integer'), {
+            'required': False,
+            'constraints': [UniqueConstraint()],
+            'item_constraints': [RangeConstraint(min=0), EnumConstraint(range(0, 100))],
+        })
+
+
+class TestConstraints(object):
+    def test_valid(self):
+        handler = DataHandler()
+        handler.bind_sync({'age': 30, 'name': 'Rick', 'code': 'ABC', 'role': 'admin', 'scores': [1, 2, None]})
+
+        assert handler.is_valid()
+        assert {'age': 30, 'name': 'Rick', 'code': 'ABC', 'role': 'admin', 'scores': [1, 2, None]} == handler.get_data()
+
+    def test_missing_values_are_accepted(self):
+        handler = DataHandler()
+        handler.bind_sync({})
+
+        assert handler.is_valid()
+
+    @pytest.mark.parametrize('payload,message', [
+        ({'age': 151}, 'age must be between 0 and 150'),
+        ({'age': 'old'}, 'age must be between 0 and 150'),
+        ({'name': 'R'}, 'name length must be at least 2'),
+        ({'name': 1}, 'name length must be at least 2'),
+        ({'code': 'ABCD'}, 'code has an invalid format'),
+        ({'role': 'root'}, 'role must be one of admin, user'),
+        ({'role': ['admin']}, 'role must be one of admin, user'),
+        ({'scores': [1, 1]}, 'scores must not contain duplicate values'),
+    ])
+    def test_invalid(self, payload, message):
+        handler = DataHandler()
+        handler.bind_sync(payload)
+
+        assert [message] == handler.errors
+
+    def test_item_errors(self):
+        handler = DataHandler()
+        handler.bind_sync({'scores': [1, -1, 2, 200, None]}, collect_errors=True)
+
+        assert [
+            {'path': '/scores/1', 'message': 'scores must be greater than or equal to 0'},
+            {'path': '/scores/3', 'message': 'scores must be one of ' + ', '.join(sorted(map(str, range(0, 100))))},
+        ] == handler.get_errors()
+
+    @pytest.mark.asyncio
+    async def test_bind(self):
+        handler = DataHandler()
+        await handler.bind({'age': 30, 'scores': [5, -5]})
+
+        assert ['scores must be greater than or equal to 0'] == handler.errors
+
+        await handler.bind({'age': 30, 'scores': [5, 6]})
+
+        assert handler.is_valid()
+
+    def test_unhashable_unique_values(self):
+        constraint = UniqueConstraint()
+
+        assert constraint.validate([{'a': 1}, {'a': 2}])
+        assert not constraint.validate([{'a': 1}, {'a': 1}])
+
+    def test_custom_message(self):
+        class MessageHandler(InputHandler):
+            def define(self):
+                self.add('age', 'integer', {'constraints': [RangeConstraint(max=10, message=r'{field} is too big')]})
+
+        handler = MessageHandler()
+        handler.bind_sync({'age': 11})
+
+        assert ['age is too big'] == handler.errors
+
+    def test_nan(self):
+        class FloatHandler(InputHandler):
+            def define(self):
+                self.add('values', ListNode('float'), {'item_constraints': [RangeConstraint(0, 10)]})
+
+        handler = FloatHandler()
+
+        for values in [[5, float('nan')], [float('nan'), 5], [float('nan')]]:
+            handler.bind_sync({'values': values})
+
+            assert not handler.is_valid()
+
+    def test_range_requires_a_bound(self):
+        with pytest.raises(ValueError):
+            RangeConstraint()
+
+        with pytest.raises(ValueError):
+            LengthConstraint()
+
+    def test_compile_is_abstract(self):
+        class EmptyConstraint(DeclarativeConstraint):
+            pass
+
+        with pytest.raises(TypeError):
+            EmptyConstraint('{field} is invalid')
@@ -0,0 +1,65 @@
+from datetime import datetime
+import pytest
+from fractal_input import InputHandler, ListNode, DatetimeNode
+from fractal_input.date_parser import compile_parser
+
+
+CASES = [
+    ('%Y-%m-%d', '2020-01-02'),
+    ('%Y-%m-%d', '2020-1-2'),
+    ('%Y-%m-%d', '2020-02-30'),
+    ('%Y-%m-%d', '2020-01-02T10:00'),
+    ('%Y-%m-%d', '20200102'),
+    ('%Y-%m-%dT%H:%M:%S', '2020-01-02T10:11:12'),
+    ('%Y-%m-%dT%H:%M:%S', '2020-01-02t10:11:12'),
+    ('%Y-%m-%dT%H:%M:%S', '2020-01-02T24:11:12'),
+    ('%Y-%m-%d %H:%M:%S', '2020-01-02   10:11:12'),
+    ('%m/%d/%y %H:%M:%S', '01/02/69 10:11:12'),
+    ('%m/%d/%y %H:%M:%S', '01/02/68 10:11:12'),
+    ('%H:%M:%S.%f', '10:11:12.5'),
+    ('%d.%m.%Y', '2.1.2020'),
+    ('%b %d %Y', 'Jan 02 2020'),
+    ('%d', '29'),
+    ('%Y', '२०२०'),
+]
+
+
+class TestDatetimeNode(object):
+    @pytest.mark.parametrize('formatter, value', CASES)
+    def test_parser_matches_strptime(self, formatter, value):
+        def parse(parser):
+            try:
+                return parser(value)
+            except ValueError as e:
+                return str(e)
+
+        assert parse(lambda value: datetime.strptime(value, formatter)) == parse(compile_parser(formatter))
+
+    def test_iso_without_formatter(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('created', DatetimeNode())
+
+        handler = DataHandler()
+        handler.bind_sync({'created': '2020-01-02T10:11:12+00:00'})
+
+        assert 2020 == handler.get_data()['created'].year
+        assert handler.get_data()['created'].tzinfo is not None
+
+        handler.bind_sync({'created': 'lala'})
+
+        assert handler.get_error_as_string().startswith('Invalid created:')
+
+    def test_cached_parser(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('events', ListNode(DatetimeNode('%Y-%m-%d', cache_size=16)))
+
+        handler = DataHandler()
+        handler.bind_sync({'events': ['2020-01-02', '2020-01-02', '2020-01-03']})
+
+        parser = handler.get_schema().root_node.children[0].get_inner_node().get_parser()
+
+        assert [2, 2, 3] == [value.day for value in handler.get_data()['events']]
+        assert 1 == parser.cache_info().hits
+        assert 2 == parser.cache_info().misses
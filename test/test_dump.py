@@ -0,0 +1,120 @@
+import json
+import pytest
+from datetime import datetime
+from fractal_input import InputHandler, ListNode, DatetimeNode
+from fractal_input import schema as schema_module
+
+
+class Address(object):
+    street = None
+    number = None
+
+
+class User(object):
+    name = None
+    created = None
+    address = None
+    password = None
+
+
+class Click(object):
+    type = None
+    x = None
+
+
+class UserHandler(InputHandler):
+    def define(self):
+        user = self.add('user', User)
+        user.add('name', 'string')
+        user.add('created', DatetimeNode('%d/%m/%Y'))
+        user.add('updated', DatetimeNode(), {'required': False})
+        address = user.add('address', Address, {'required': False})
+        address.add('street', 'string')
+        address.add('number', 'integer')
+        self.add('tags', ListNode('string'), {'required': False})
+        self.add('scores', ListNode('float'), {'required': False, 'array': True})
+        self.add('meta', 'dict', {'required': False, 'unknown': 'keep'}).add('source', 'string')
+        events = self.add('events', ListNode('union'), {'required': False})
+        events.add('click', Click).add('x', 'integer')
+        events.add('key', 'dict').add('key', 'string')
+
+
+PAYLOAD = {
+    'user': {'name': 'Rick', 'created': '02/01/2020', 'updated': '2020-01-03T10:00:00', 'address': {'street': 'Lala', 'number': 1}},
+    'tags': ['a', 'b'],
+    'meta': {'source': 'web', 'extra': 1},
+    'events': [{'x': 1}, {'key': 'a'}],
+}
+
+EXPECTED = {
+    'user': {
+        'name': 'Rick',
+        'created': '02/01/2020',
+        'updated': '2020-01-03T10:00:00',
+        'address': {'street': 'Lala', 'number': 1},
+    },
+    'tags': ['a', 'b'],
+    'meta': {'source': 'web', 'extra': 1},
+    'events': [{'x': 1}, {'key': 'a'}],
+}
+
+
+class TestDump(object):
+    def test_round_trip(self):
+        handler = UserHandler()
+        handler.bind_sync(PAYLOAD)
+
+        assert handler.is_valid()
+        assert EXPECTED == handler.dump(handler.get_data())
+        assert EXPECTED == json.loads(handler.dump_json(handler.get_data()))
+
+    def test_declared_fields_only(self):
+        user = User()
+        user.name = 'Rick'
+        user.created = datetime(2020, 1, 2)
+        user.password = 'secret'
+
+        data = UserHandler().dump({'user': user, 'other': 1})
+
+        assert {'user': {'name': 'Rick', 'created': '02/01/2020', 'updated': None, 'address': None}} == data
+
+    def test_arrays(self):
+        numpy = pytest.importorskip('numpy')
+
+        data = UserHandler().dump({'user': None, 'scores': numpy.array([1.5, 2.0])})
+
+        assert {'user': None, 'scores': [1.5, 2.0]} == data
+
+    def test_dump_json_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(schema_module, 'orjson', None)
+
+        handler = UserHandler()
+        handler.bind_sync(PAYLOAD)
+
+        assert json.dumps(EXPECTED, separators=(',', ':')).encode('utf-8') == handler.dump_json(handler.get_data())
+
+    def test_union_without_match(self):
+        with pytest.raises(ValueError):
+            UserHandler().dump({'user': None, 'events': [object()]})
+
+    def test_lazy_outputs(self):
+        handler = UserHandler()
+        handler.bind_sync(PAYLOAD, lazy=True)
+
+        assert EXPECTED == handler.dump(handler.get_data())
+
+    def test_union_discriminator(self):
+        class EventHandler(InputHandler):
+            def define(self):
+                event = self.add('event', 'union', {'discriminator': 'type'})
+                event.add('click', Click).add('x', 'integer')
+                event.add('key', 'dict').add('key', 'string')
+
+        handler = EventHandler()
+        handler.bind_sync({'event': {'type': 'click', 'x': 1}})
+
+        assert {'event': {'x': 1, 'type': 'click'}} == handler.dump(handler.get_data())
+
+        handler.bind_sync({'event': {'type': 'key', 'key': 'a'}})
+
+        assert {'event': {'key': 'a', 'type': 'key'}} == handler.dump(handler.get_data())
@@ -1,5 +1,13 @@
 import pytest
-from fractal_input import InputHandler
+import time
+from fractal_input import InputHandler, ListNode
+from fractal_input.email_address import is_email, partition_emails
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('email', 'email', {'required': False})
+        self.add('emails', ListNode('email'), {'required': False})
 
 
 class TestEmailNode(object):
@@ -76,3 +84,53 @@ class TestEmailNode(object):
 
         assert handler.is_valid()
         assert handler.get_data()['email'] == 'admin@example.com'
+
+    def test_normalize(self):
+        handler = DataHandler()
+        handler.bind_sync({'email': ' Rick@Rick.COM '})
+
+        assert {'email': 'rick@rick.com'} == handler.get_data()
+
+    def test_is_email(self):
+        assert is_email('rick@rick.com')
+        assert is_email('a.b+c@sub-domain.example.com')
+        assert is_email('rick@localhost')
+        assert not is_email('rick')
+        assert not is_email('rick@')
+        assert not is_email('@rick.com')
+        assert not is_email('rick@rick..com')
+        assert not is_email('rick@-rick.com')
+        assert not is_email('rick@rick-.com')
+        assert not is_email('rick@rick@rick.com')
+
+    def test_length_limits(self):
+        assert is_email('a' * 64 + '@rick.com')
+        assert not is_email('a' * 65 + '@rick.com')
+        assert is_email('rick@' + 'a' * 63 + '.com')
+        assert not is_email('rick@' + 'a' * 64 + '.com')
+        assert not is_email('rick@' + '.'.join(['a' * 60] * 5))
+
+    def test_pathological_input(self):
+        started_at = time.perf_counter()
+
+        handler = DataHandler()
+        handler.bind_sync({'email': 'a@' + 'a-' * 100000 + '!'})
+
+        assert not handler.is_valid()
+        assert time.perf_counter() - started_at < 1
+
+    def test_list(self):
+        handler = DataHandler()
+        handler.bind_sync({'emails': ['A@b.com', None, 'c@d.com']})
+
+        assert {'emails': ['a@b.com', None, 'c@d.com']} == handler.get_data()
+
+        handler.bind_sync({'emails': ['a@b.com', 'invalid', 'c@d.com', 'other']}, collect_errors=True)
+
+        assert [
+            {'path': '/emails/1', 'message': 'Invalid root: invalid is not a valid email address'},
+            {'path': '/emails/3', 'message': 'Invalid root: other is not a valid email address'},
+        ] == handler.get_errors()
+
+    def test_partition_emails(self):
+        assert (['a@b.com', 'c@d.com'], ['invalid', None]) == partition_emails(['A@b.com', 'invalid', None, 'c@d.com'])
@@ -0,0 +1,85 @@
+import pytest
+from fractal_input import InputHandler, ListNode
+from .nodes import UpperNode
+
+
+class User(object):
+    pass
+
+
+class Telephone(object):
+    pass
+
+
+class UserHandler(InputHandler):
+    def define(self):
+        user = self.add('user', User)
+        user.add('name', 'string')
+        user.add('email', 'email')
+        telephones = user.add('telephones', ListNode(Telephone))
+        telephones.add('number', 'string')
+        self.add('a/b~c', 'integer')
+
+
+PAYLOAD = {
+    'user': {
+        'email': 'invalid',
+        'telephones': [{'number': '1'}, {}, {'number': '3'}, {}],
+    },
+}
+
+
+class TestErrors(object):
+    @pytest.mark.asyncio
+    async def test_fail_fast_error_has_path(self):
+        handler = UserHandler()
+        await handler.bind(PAYLOAD)
+
+        assert ['name is required'] == handler.errors
+        assert [{'path': '/user/name', 'message': 'name is required'}] == handler.get_errors()
+
+    @pytest.mark.asyncio
+    async def test_collect_errors(self):
+        handler = UserHandler()
+        await handler.bind(PAYLOAD, collect_errors=True)
+
+        assert not handler.is_valid()
+        assert handler.get_data() is None
+        assert [
+            {'path': '/user/name', 'message': 'name is required'},
+            {'path': '/user/email', 'message': 'Invalid email: invalid is not a valid email address'},
+            {'path': '/user/telephones/1/number', 'message': 'number is required'},
+            {'path': '/user/telephones/3/number', 'message': 'number is required'},
+            {'path': '/a~1b~0c', 'message': 'a/b~c is required'},
+        ] == handler.get_errors()
+
+    def test_collect_errors_sync_matches_async(self):
+        handler = UserHandler()
+        handler.bind_sync(PAYLOAD, collect_errors=True)
+
+        assert 5 == len(handler.errors)
+        assert '/user/telephones/3/number' == handler.get_errors()[3]['path']
+
+    @pytest.mark.asyncio
+    async def test_collect_errors_in_async_walk(self):
+        class AsyncHandler(InputHandler):
+            def define(self):
+                self.add('name', UpperNode())
+                items = self.add('items', ListNode('dict'))
+                items.add('id', 'integer')
+
+        handler = AsyncHandler()
+        await handler.bind({'items': [{}, {'id': 1}, {}]}, collect_errors=True)
+
+        assert ['/name', '/items/0/id', '/items/2/id'] == [error['path'] for error in handler.get_errors()]
+
+    def test_max_errors(self):
+        handler = UserHandler()
+        handler.bind_sync(PAYLOAD, collect_errors=True, max_errors=3)
+
+        assert ['/user/name', '/user/email', '/user/telephones/1/number'] == [error['path'] for error in handler.get_errors()]
+
+    def test_collect_errors_on_batch(self):
+        result = UserHandler().bind_many_sync([PAYLOAD], collect_errors=True, max_errors=2)
+
+        assert ['name is required', 'Invalid email: invalid is not a valid email address'] == result.get_errors(0)
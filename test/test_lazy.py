@@ -0,0 +1,127 @@
+import pytest
+from fractal_input import InputHandler, ListNode
+from fractal_input.constraint import ConstraintException, LengthConstraint, RangeConstraint
+from fractal_input.lazy import LazyDict, LazyList, unwrap
+
+
+class Address(object):
+    street = None
+    number = None
+
+    def describe(self):
+        return '{}, {}'.format(self.street, self.number)
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        user = self.add('user', 'dict')
+        user.add('name', 'string')
+        user.add('role', 'string', {'required': False})
+        user.add('age', 'integer', {'required': False, 'constraints': [RangeConstraint(0, 150)]})
+        address = user.add('address', Address, {'required': False})
+        address.add('street', 'string')
+        address.add('number', 'integer')
+        self.add('telephones', ListNode('dict'), {'required': False}).add('number', 'string')
+        self.add('tags', ListNode('string'), {'required': False})
+
+
+PAYLOAD = {
+    'user': {'name': 'Rick', 'age': 70, 'address': {'street': 'Lala', 'number': '1'}},
+    'telephones': [{'number': 1}, {'number': 2}],
+    'tags': ['a'],
+}
+
+
+class TestLazy(object):
+    def test_lazy_bind(self):
+        handler = DataHandler()
+        handler.bind_sync(PAYLOAD, lazy=True)
+        data = handler.get_data()
+
+        assert handler.is_valid()
+        assert isinstance(data, LazyDict)
+        assert isinstance(data['telephones'], LazyList)
+        assert 70 == data['user']['age']
+        assert ['a'] == data['tags']
+        assert '2' == data['telephones'][-1]['number']
+        assert ['user', 'telephones', 'tags'] == list(data)
+
+    def test_same_output(self):
+        handler = DataHandler()
+        handler.bind_sync(PAYLOAD)
+        expected = handler.get_data()
+
+        handler.bind_sync(PAYLOAD, lazy=True)
+        data = unwrap(handler.get_data())
+
+        assert expected['telephones'] == data['telephones']
+        assert expected['tags'] == handler.get_data()['tags']
+        assert vars(expected['user']['address']) == vars(data['user']['address'])
+
+    def test_lazy_object(self):
+        handler = DataHandler()
+        handler.bind_sync(PAYLOAD, lazy=True)
+        address = handler.get_data()['user']['address']
+
+        assert isinstance(address, Address)
+        assert 1 == address.number
+        assert 'Lala, 1' == address.describe()
+
+    def test_required_fields_are_checked_at_bind(self):
+        handler = DataHandler()
+        handler.bind_sync({'user': {'address': {'street': 'Lala', 'number': 1}}}, lazy=True)
+
+        assert [{'path': '/user/name', 'message': 'name is required'}] == handler.get_errors()
+
+        handler.bind_sync({'user': {'name': 'Rick', 'address': {'street': 'Lala'}}}, lazy=True)
+
+        assert [{'path': '/user/address/number', 'message': 'number is required'}] == handler.get_errors()
+
+        handler.bind_sync({'user': {'name': 'Rick'}, 'telephones': [{'number': 1}, {}]}, lazy=True)
+
+        assert [{'path': '/telephones/1/number', 'message': 'number is required'}] == handler.get_errors()
+
+    def test_invalid_fields_raise_on_access(self):
+        handler = DataHandler()
+        handler.bind_sync({'user': {'name': 'Rick', 'age': 200}}, lazy=True)
+        user = handler.get_data()['user']
+
+        assert 'Rick' == user['name']
+
+        with pytest.raises(ConstraintException) as info:
+            user['age']
+
+        assert '/age' == info.value.get_pointer()
+        assert 'age must be between 0 and 150' == str(info.value)
+
+    def test_container_types_are_checked_at_bind(self):
+        handler = DataHandler()
+        handler.bind_sync({'user': {'name': 'Rick', 'address': 1}}, lazy=True)
+
+        assert [{'path': '/user/address', 'message': 'Invalid field address: 1'}] == handler.get_errors()
+
+        handler.bind_sync({'user': {'name': 'Rick'}, 'tags': 1}, lazy=True)
+
+        assert handler.is_valid()
+        assert {'name': 'Rick'} == unwrap(handler.get_data())['user']
+
+    def test_constrained_containers_are_checked_at_bind(self):
+        class ConstrainedHandler(InputHandler):
+            def define(self):
+                self.add('addresses', ListNode(Address), {'constraints': [LengthConstraint(max=10)]}).add('street', 'string')
+
+        handler = ConstrainedHandler()
+        handler.bind_sync({'addresses': [{}]}, lazy=True)
+
+        assert [{'path': '/addresses/0/street', 'message': 'street is required'}] == handler.get_errors()
+
+        handler.bind_sync({'addresses': [{'street': 'Lala'}]}, lazy=True)
+
+        assert 'Lala' == handler.get_data()['addresses'][0].street
+
+    def test_bind_many(self):
+        handler = DataHandler()
+        result = handler.bind_many_sync([PAYLOAD, {}], lazy=True)
+
+        assert 1 == result.count_valid()
+        assert 'Rick' == result.outputs[0]['user']['name']
@@ -0,0 +1,74 @@
+import pytest
+from fractal_input import InputHandler, ListNode
+from fractal_input import node as node_module
+
+
+class ScalarHandler(InputHandler):
+    def define(self):
+        self.add('integers', ListNode('integer'))
+        self.add('floats', ListNode('float'), {'required': False})
+        self.add('strings', ListNode('string'), {'required': False})
+        self.add('booleans', ListNode('boolean'), {'required': False})
+        self.add('array', ListNode('float'), {'required': False, 'array': True})
+
+
+class TestListNode(object):
+    def test_scalar_lists(self):
+        handler = ScalarHandler()
+        handler.bind_sync({
+            'integers': ['1', 2, 3.0],
+            'floats': (1, '2.5'),
+            'strings': [1, None, 'a'],
+            'booleans': [0, 1, None],
+        })
+
+        assert handler.is_valid()
+        assert {
+            'integers': [1, 2, 3],
+            'floats': [1.0, 2.5],
+            'strings': ['1', None, 'a'],
+            'booleans': [False, True, None],
+        } == handler.get_data()
+
+    @pytest.mark.asyncio
+    async def test_scalar_lists_match_async_walk(self):
+        handler = ScalarHandler()
+        root = handler.get_schema().root_node
+        payload = {'integers': [1, '2', None], 'strings': 'abc', 'booleans': 1}
+
+        handler.bind_sync(payload)
+
+        assert await root.get_value(await root.walk(payload)) == handler.get_data()
+
+    def test_required_list(self):
+        handler = ScalarHandler()
+        handler.bind_sync({'integers': None})
+
+        assert 'integers is required' == handler.get_error_as_string()
+
+    def test_invalid_item(self):
+        handler = ScalarHandler()
+
+        with pytest.raises(ValueError):
+            handler.bind_sync({'integers': [1, 'a']})
+
+    def test_array_without_numpy(self, monkeypatch):
+        monkeypatch.setattr(node_module, 'numpy', None)
+
+        handler = ScalarHandler()
+        handler.bind_sync({'integers': [], 'array': [1, '2.5']})
+
+        assert [1.0, 2.5] == handler.get_data()['array']
+
+    def test_array_with_numpy(self):
+        numpy = pytest.importorskip('numpy')
+
+        handler = ScalarHandler()
+        handler.bind_sync({'integers': [], 'array': [1, '2.5']})
+
+        assert isinstance(handler.get_data()['array'], numpy.ndarray)
+        assert [1.0, 2.5] == handler.get_data()['array'].tolist()
+
+        handler.bind_sync({'integers': [], 'array': [1, None]})
+
+        assert [1.0, None] == handler.get_data()['array']
@@ -0,0 +1,109 @@
+from collections import namedtuple
+from dataclasses import dataclass
+import pytest
+from fractal_input import InputHandler, ListNode
+
+
+@dataclass(frozen=True)
+class Point(object):
+    x: int
+    y: int = 0
+
+
+Size = namedtuple('Size', ['width', 'height'])
+
+
+class Slotted(object):
+    __slots__ = ('name',)
+
+
+class Strict(object):
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        raise TypeError('name is read only')
+
+
+class Counted(object):
+    instances = 0
+
+    def __init__(self, name, email=None):
+        Counted.instances += 1
+        self.name = name
+        self.email = email
+
+
+class TestObjectNode(object):
+    def test_dataclass_and_namedtuple(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                point = self.add('point', Point)
+                point.add('x', 'integer')
+                point.add('y', 'integer', {'required': False})
+                size = self.add('size', Size)
+                size.add('width', 'integer')
+                size.add('height', 'integer')
+
+        handler = DataHandler()
+        handler.bind_sync({'point': {'x': '1'}, 'size': {'width': 2, 'height': 3}})
+
+        assert Point(1, 0) == handler.get_data()['point']
+        assert Size(2, 3) == handler.get_data()['size']
+
+    def test_slots_class(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('slotted', Slotted).add('name', 'string')
+
+        handler = DataHandler()
+        handler.bind_sync({'slotted': {'name': 'a'}})
+
+        assert 'a' == handler.get_data()['slotted'].name
+
+    def test_constructor_runs_once(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                counted = self.add('counted', Counted)
+                counted.add('name', 'string')
+                counted.add('email', 'string', {'required': False})
+
+        Counted.instances = 0
+
+        handler = DataHandler()
+        handler.bind_sync({'counted': {'name': 'a'}})
+
+        assert 'a' == handler.get_data()['counted'].name
+        assert 1 == Counted.instances
+
+    def test_type_errors_are_not_hidden(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('strict', Strict).add('name', 'string')
+
+        with pytest.raises(TypeError):
+            DataHandler().bind_sync({'strict': {'name': 'a'}})
+
+    @pytest.mark.asyncio
+    async def test_generated_slots_class(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                user = self.add('user', 'object')
+                user.add('name', 'string')
+                user.add('age', 'integer', {'required': False})
+                telephones = user.add('telephones', ListNode('object'), {'required': False})
+                telephones.add('number', 'string')
+
+        handler = DataHandler()
+        await handler.bind({'user': {'name': 'Rick', 'telephones': [{'number': 1}]}})
+
+        user = handler.get_data()['user']
+
+        assert 'Rick' == user.name
+        assert user.age is None
+        assert '1' == user.telephones[0].number
+        assert not hasattr(user, '__dict__')
+        assert "user(name='Rick', age=None, telephones=[root(number='1')])" == repr(user)
+        assert type(user)(name='Rick', telephones=user.telephones) == user
@@ -0,0 +1,61 @@
+import pytest
+from fractal_input import InputHandler, ListNode, NodeProfiler
+from fractal_input.constraint import Constraint
+from fractal_input.schema import AsyncSchemaException
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('name', 'string')
+        self.add('role', 'string', {'required': False})
+        self.add('scores', ListNode('integer'), {'required': False})
+
+
+class TestParallel(object):
+    def test_bind_many_parallel(self):
+        records = [{'name': 'Rick', 'scores': [index]} if index % 3 else {'scores': [index]} for index in range(50)]
+
+        handler = DataHandler()
+        result = handler.bind_many_parallel(records, defaults={'role': 'user'}, workers=2, chunk_size=4, collect_errors=True)
+        expected = handler.bind_many_sync(records, defaults={'role': 'user'}, collect_errors=True)
+
+        assert 50 == len(result)
+        assert 33 == result.count_valid()
+        assert list(expected) == list(result)
+        assert {'name': 'Rick', 'role': 'user', 'scores': [1]} == result.outputs[1]
+
+    def test_generated_classes(self):
+        class ObjectHandler(InputHandler):
+            def define(self):
+                self.add('user', 'object').add('name', 'string')
+
+        handler = ObjectHandler()
+        result = handler.bind_many_parallel([{'user': {'name': 'Rick'}}], workers=1)
+        user = result.outputs[0]['user']
+
+        assert 'Rick' == user.name
+        assert type(user) is handler.get_schema().root_node.children[0].get_object_class()
+
+    def test_empty(self):
+        assert 0 == len(DataHandler().bind_many_parallel([], workers=1))
+
+    def test_local_options(self):
+        with pytest.raises(ValueError):
+            DataHandler().bind_many_parallel([{'name': 'Rick'}], workers=1, profiler=NodeProfiler())
+
+        with pytest.raises(ValueError):
+            DataHandler().bind_many_parallel([{'name': 'Rick'}], workers=1, lazy=True)
+
+    def test_async_schema(self):
+        class AvailableConstraint(Constraint):
+            message = r'{field} is taken'
+
+            async def validate(self, value):
+                return True
+
+        class AsyncHandler(InputHandler):
+            def define(self):
+                self.add('name', 'string', {'constraints': [AvailableConstraint()]})
+
+        with pytest.raises(AsyncSchemaException):
+            AsyncHandler().bind_many_parallel([{'name': 'Rick'}], workers=1)
@@ -0,0 +1,131 @@
+import pytest
+from fractal_input import InputHandler, ListNode
+from fractal_input.constraint import UniqueConstraint
+from .nodes import EchoNode
+
+
+class Address(object):
+    street = None
+    number = None
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        user = self.add('user', 'dict')
+        user.add('name', 'string')
+        user.add('role', 'string', {'required': False})
+        address = user.add('address', Address)
+        address.add('street', 'string')
+        address.add('number', 'integer')
+        self.add('tags', ListNode('string'), {'required': False, 'constraints': [UniqueConstraint()]})
+        self.add('telephones', ListNode('dict'), {'required': False}).add('number', 'string')
+
+
+PAYLOAD = {
+    'user': {'name': 'Rick', 'address': {'street': 'Lala', 'number': 1}},
+    'tags': ['a', 'b'],
+    'telephones': [{'number': '1'}, {'number': '2'}],
+}
+
+
+def patch(payload, path, value):
+    payload = {key: value for key, value in payload.items()}
+    payload['user'] = dict(payload['user'])
+    payload['user']['address'] = dict(payload['user']['address'])
+    target = payload
+
+    for key in path[:-1]:
+        target = target[key]
+
+    target[path[-1]] = value
+    return payload
+
+
+class TestPatch(object):
+    def test_rebind_reuses_unchanged_subtrees(self):
+        handler = DataHandler()
+        handler.bind_sync(PAYLOAD)
+        previous = handler.get_data()
+
+        handler.rebind_sync(patch(PAYLOAD, ['user', 'name'], 'Morty'), ['/user/name'])
+        data = handler.get_data()
+
+        assert handler.is_valid()
+        assert 'Morty' == data['user']['name']
+        assert data['user'] is not previous['user']
+        assert data['user']['address'] is previous['user']['address']
+        assert data['tags'] is previous['tags']
+        assert 'Rick' == previous['user']['name']
+
+    def test_rebind_object(self):
+        handler = DataHandler()
+        handler.bind_sync(PAYLOAD)
+        previous = handler.get_data()
+
+        handler.rebind_sync(patch(PAYLOAD, ['user', 'address', 'number'], '2'), [('user', 'address', 'number')])
+        address = handler.get_data()['user']['address']
+
+        assert isinstance(address, Address)
+        assert address is not previous['user']['address']
+        assert ('Lala', 2) == (address.street, address.number)
+
+    def test_rebind_list_items(self):
+        handler = DataHandler()
+        handler.bind_sync(PAYLOAD)
+        previous = handler.get_data()
+
+        payload = dict(PAYLOAD, telephones=[{'number': '1'}, {'number': 3}])
+        handler.rebind_sync(payload, ['/telephones/1/number'])
+        telephones = handler.get_data()['telephones']
+
+        assert [{'number': '1'}, {'number': '3'}] == telephones
+        assert telephones[0] is previous['telephones'][0]
+
+        handler.rebind_sync(dict(PAYLOAD, telephones=[{'number': '5'}]), ['/telephones/0'])
+
+        assert [{'number': '5'}] == handler.get_data()['telephones']
+
+    def test_rebind_errors(self):
+        handler = DataHandler()
+        handler.bind_sync(PAYLOAD)
+
+        handler.rebind_sync(dict(PAYLOAD, tags=['a', 'a']), ['/tags/1'])
+
+        assert ['tags must not contain duplicate values'] == handler.errors
+
+        handler.bind_sync(PAYLOAD)
+        handler.rebind_sync(patch(PAYLOAD, ['user', 'name'], None), ['/user/name'])
+
+        assert [{'path': '/user/name', 'message': 'name is required'}] == handler.get_errors()
+
+    def test_rebind_removed_optional_field(self):
+        handler = DataHandler()
+        handler.bind_sync(patch(PAYLOAD, ['user', 'role'], 'admin'))
+
+        handler.rebind_sync(PAYLOAD, ['/user/role'])
+
+        assert 'role' not in handler.get_data()['user']
+
+    def test_rebind_after_invalid_bind(self):
+        handler = DataHandler()
+        handler.bind_sync({})
+        handler.rebind_sync(PAYLOAD, ['/user/name'])
+
+        assert handler.is_valid()
+        assert 'Rick' == handler.get_data()['user']['name']
+
+    @pytest.mark.asyncio
+    async def test_rebind(self):
+        class AsyncHandler(InputHandler):
+            def define(self):
+                self.add('name', EchoNode())
+                self.add('tags', ListNode(EchoNode()))
+
+        handler = AsyncHandler()
+        await handler.bind({'name': 'Rick', 'tags': ['a', 'b']})
+        previous = handler.get_data()
+
+        await handler.rebind({'name': 'Morty', 'tags': ['a', 'b']}, ['/name'])
+
+        assert {'name': 'Morty', 'tags': ['a', 'b']} == handler.get_data()
+        assert handler.get_data()['tags'] is previous['tags']
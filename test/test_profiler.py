@@ -0,0 +1,95 @@
+import pytest
+from fractal_input import InputHandler, ListNode, NodeProfiler
+from fractal_input.constraint import Constraint
+from .nodes import EchoNode
+
+
+class PositiveConstraint(Constraint):
+    def __init__(self):
+        self.message = r'{field} must be positive'
+
+    def validate(self, value):
+        return value > 0
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('name', 'string')
+        address = self.add('address', 'dict')
+        address.add('number', 'integer', {'constraints': [PositiveConstraint()]})
+        self.add('tags', ListNode('string'), {'required': False})
+
+
+class TestProfiler(object):
+    def test_bind_sync_records_every_node(self):
+        profiler = NodeProfiler()
+
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'address': {'number': 1}, 'tags': ['a']}, profiler=profiler)
+
+        stats = profiler.to_dict()
+
+        assert handler.is_valid()
+        assert {'name': 'Rick', 'address': {'number': 1}, 'tags': ['a']} == handler.get_data()
+        assert {'/', '/name', '/address', '/address/number', '/tags'} == set(stats)
+        assert 1 == stats['/address/number']['calls']
+        assert 0 == stats['/address/number']['failures']
+        assert stats['/']['total_seconds'] >= stats['/address']['total_seconds']
+
+    def test_failures(self):
+        profiler = NodeProfiler()
+
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'address': {'number': -1}}, profiler=profiler)
+
+        assert ['number must be positive'] == handler.errors
+
+        handler.bind_sync({'name': 'Rick', 'address': {'number': 2}}, profiler=profiler)
+
+        stats = profiler.to_dict()
+
+        assert handler.is_valid()
+        assert 2 == stats['/address/number']['calls']
+        assert 1 == stats['/address/number']['failures']
+        assert 1 == stats['/']['failures']
+
+    @pytest.mark.asyncio
+    async def test_bind_async_nodes(self):
+        class AsyncHandler(InputHandler):
+            def define(self):
+                self.add('tags', ListNode(EchoNode()))
+
+        profiler = NodeProfiler()
+
+        handler = AsyncHandler()
+        await handler.bind({'tags': ['a', 'b']}, profiler=profiler)
+
+        stats = profiler.to_dict()
+
+        assert {'tags': ['a', 'b']} == handler.get_data()
+        assert 2 == stats['/tags/*']['calls']
+        assert stats['/tags/*']['transform_seconds'] >= 0
+
+    def test_sample_rate(self):
+        profiler = NodeProfiler(sample_rate=0)
+
+        handler = DataHandler()
+        result = handler.bind_many_sync([{'name': 'Rick', 'address': {'number': 1}}] * 3, profiler=profiler)
+
+        assert 3 == result.count_valid()
+        assert {} == profiler.to_dict()
+
+    def test_to_prometheus(self):
+        profiler = NodeProfiler()
+
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'address': {'number': 1}}, profiler=profiler)
+
+        output = profiler.to_prometheus()
+
+        assert '# TYPE fractal_input_node_calls_total counter' in output
+        assert 'fractal_input_node_calls_total{path="/address/number"} 1' in output
+
+        profiler.reset()
+
+        assert {} == profiler.to_dict()
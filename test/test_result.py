@@ -0,0 +1,108 @@
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from fractal_input import InputHandler, BindResult
+from fractal_input.node import StringNode
+
+
+class SlowNode(StringNode):
+    async def transform(self, value):
+        await asyncio.sleep(0.01)
+        return value
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('name', 'string')
+        self.add('age', 'integer', {'required': False})
+
+
+class TestBindResult(object):
+    def test_validate_sync(self):
+        handler = DataHandler()
+        result = handler.validate_sync({'name': 'Rick', 'age': '3'})
+
+        assert isinstance(result, BindResult)
+        assert result.is_valid()
+        assert {'name': 'Rick', 'age': 3} == result.data
+        assert [] == result.errors
+        assert None is result.get_error_as_string()
+        assert None is handler.get_data()
+
+        result = handler.validate_sync({})
+
+        assert not result.is_valid()
+        assert None is result.data
+        assert ['name is required'] == result.errors
+        assert [{'path': '/name', 'message': 'name is required'}] == result.get_errors()
+        assert 'name is required' == result.get_error_as_string()
+
+        with pytest.raises(AttributeError):
+            result.data = {}
+
+        with pytest.raises(AttributeError):
+            result.exceptions.append(None)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_validate(self):
+        class SlowHandler(InputHandler):
+            def define(self):
+                self.add('name', SlowNode())
+
+        handler = SlowHandler()
+        names = ['name{}'.format(index) for index in range(20)]
+
+        results = await asyncio.gather(*[handler.validate({'name': name}) for name in names])
+
+        assert names == [result.data['name'] for result in results]
+
+    def test_threads(self):
+        handler = DataHandler()
+
+        def validate(index):
+            return handler.validate_sync({'name': 'name{}'.format(index), 'age': index})
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(validate, range(200)))
+
+        assert list(range(200)) == [result.data['age'] for result in results]
+
+    def test_threads_with_cache(self):
+        class CachedHandler(InputHandler):
+            def define(self):
+                self.add('name', SlowNode(), {'cache': True})
+
+        handler = CachedHandler()
+
+        def validate(index):
+            return asyncio.run(handler.validate({'name': 'name{}'.format(index % 2)}))
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(validate, range(20)))
+
+        assert ['name{}'.format(index % 2) for index in range(20)] == [result.data['name'] for result in results]
+
+    def test_nested_schema_build(self):
+        class InnerHandler(InputHandler):
+            def define(self):
+                self.add('name', 'string')
+
+        class OuterHandler(InputHandler):
+            def define(self):
+                self.add('inner', 'dict')
+                InnerHandler().get_schema()
+
+        thread = Thread(target=OuterHandler().get_schema, daemon=True)
+        thread.start()
+        thread.join(5)
+
+        assert not thread.is_alive()
+        assert OuterHandler in InputHandler.schemas
+
+    def test_bind_keeps_state(self):
+        handler = DataHandler()
+        handler.bind_sync({'age': 1})
+
+        assert ['name is required'] == handler.errors
+        assert handler.get_result() == (None, handler.exceptions)
@@ -0,0 +1,55 @@
+import pytest
+from fractal_input import InputHandler, Schema
+from fractal_input.node import FrozenNodeException
+
+
+class TestSchema(object):
+    @pytest.mark.asyncio
+    async def test_define_runs_once_per_class(self):
+        calls = []
+
+        class DataHandler(InputHandler):
+            def define(self):
+                calls.append(self)
+                self.add('name', 'string')
+
+        first = DataHandler()
+        await first.bind({'name': 'a'})
+        await first.bind({'name': 'b'})
+
+        second = DataHandler()
+        await second.bind({'name': 'c'})
+
+        assert 1 == len(calls)
+        assert first.get_schema() is second.get_schema()
+        assert 1 == len(second.root_node.children)
+        assert {'name': 'c'} == second.get_data()
+
+    @pytest.mark.asyncio
+    async def test_schema_is_frozen(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('name', 'string')
+
+        handler = DataHandler()
+        schema = handler.get_schema()
+
+        assert isinstance(schema, Schema)
+
+        with pytest.raises(FrozenNodeException):
+            handler.add('age', 'integer')
+
+    @pytest.mark.asyncio
+    async def test_defaults_are_applied_per_bind(self):
+        class DataHandler(InputHandler):
+            def define(self):
+                self.add('name', 'string', {'required': False})
+
+        handler = DataHandler()
+
+        await handler.bind({}, defaults={'name': 'a'})
+        assert {'name': 'a'} == handler.get_data()
+
+        await handler.bind({})
+        assert {} == handler.get_data()
+        assert handler.get_schema().root_node.children[0].default is None
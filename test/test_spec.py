@@ -0,0 +1,177 @@
+import json
+import pytest
+import sys
+from fractal_input import InputHandler, ListNode, DatetimeNode, Schema, SchemaStore
+from fractal_input.constraint import Constraint, EnumConstraint, LengthConstraint, RangeConstraint, UniqueConstraint
+from fractal_input.node import StringNode
+from fractal_input.spec import SchemaSpecException, get_spec_hash
+
+
+class Telephone(object):
+    number = None
+
+
+class UpperNode(StringNode):
+    def coerce(self, value):
+        return super(UpperNode, self).coerce(value).upper()
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        user = self.add('user', 'object')
+        user.add('name', UpperNode(), {'constraints': [LengthConstraint(2, 10)]})
+        user.add('role', 'string', {'required': False, 'constraints': [EnumConstraint(['admin', 'user'])]})
+        user.add('age', 'integer', {'required': False, 'cache': {'maxsize': 10}})
+        user.add('created', DatetimeNode('%Y-%m-%d'), {'required': False})
+        self.add('telephones', ListNode(Telephone), {'required': False}).add('number', 'string')
+        self.add('scores', ListNode('integer'), {
+            'required': False,
+            'array': True,
+            'constraints': [UniqueConstraint()],
+            'item_constraints': [RangeConstraint(min=0)],
+        })
+
+
+PAYLOADS = [
+    {'user': {'name': 'rick', 'role': 'admin', 'age': '3', 'created': '2020-01-02'}, 'telephones': [{'number': 1}]},
+    {'user': {'name': 'r', 'role': 'root'}, 'scores': [1, 1, -1]},
+    {'user': None},
+]
+
+
+def as_dict(value):
+    if isinstance(value, list):
+        return [as_dict(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: as_dict(item) for key, item in value.items()}
+
+    if hasattr(value, '__slots__'):
+        return {name: as_dict(getattr(value, name)) for name in value.__slots__}
+
+    if hasattr(value, '__dict__'):
+        return {name: as_dict(item) for name, item in vars(value).items()}
+
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+
+    return value
+
+
+class TestSpec(object):
+    def test_round_trip(self):
+        schema = DataHandler().get_schema()
+        spec = schema.to_spec()
+        loaded = Schema.from_spec(json.loads(json.dumps(spec)))
+
+        assert spec == loaded.to_spec()
+        assert schema.get_hash() == loaded.get_hash()
+
+        for payload in PAYLOADS:
+            output, errors = schema.validate_sync(payload, collect_errors=True)
+            loaded_output, loaded_errors = loaded.validate_sync(payload, collect_errors=True)
+
+            assert as_dict(output) == as_dict(loaded_output)
+            assert [(e.path, e.message) for e in errors] == [(e.path, e.message) for e in loaded_errors]
+
+    def test_spec(self):
+        spec = DataHandler().get_schema().to_spec()
+        user, telephones, scores = spec['root']['children']
+
+        assert 1 == spec['version']
+        assert 'object' == user['type']
+        assert 'class' not in user
+        assert __name__ + ':UpperNode' == user['children'][0]['type']
+        assert __name__ + ':Telephone' == telephones['items']['class']
+        assert {'maxsize': 10, 'ttl': None} == user['children'][2]['cache']
+        assert '%Y-%m-%d' == user['children'][3]['formatter']
+        assert [{'type': 'range', 'message': r'{field} must be greater than or equal to 0', 'min': 0, 'max': None}] == (
+            scores['items']['constraints']
+        )
+
+    def test_invalid_spec(self):
+        class LocalHandler(InputHandler):
+            def define(self):
+                self.add('name', 'string', {'constraints': [Constraint()]})
+
+        with pytest.raises(SchemaSpecException):
+            LocalHandler().get_schema().to_spec()
+
+        with pytest.raises(SchemaSpecException):
+            Schema.from_spec({'version': 0})
+
+        with pytest.raises(SchemaSpecException):
+            Schema.from_spec({'version': 1, 'root': {'type': 'json:loads', 'name': 'root'}})
+
+    def test_store(self, tmp_path):
+        InputHandler.schemas.pop(DataHandler, None)
+        store = SchemaStore(str(tmp_path))
+
+        assert not store.load(DataHandler)
+
+        store.warm_start([DataHandler])
+        schema = InputHandler.schemas.pop(DataHandler)
+
+        assert store.load(DataHandler)
+        assert InputHandler.schemas[DataHandler] is not schema
+        assert schema.get_hash() == InputHandler.schemas[DataHandler].get_hash()
+
+        handler = DataHandler()
+        handler.bind_sync(PAYLOADS[0])
+
+        assert handler.is_valid()
+        assert 'RICK' == handler.get_data()['user'].name
+
+    def test_stale_store(self, tmp_path):
+        store = SchemaStore(str(tmp_path))
+        store.save(DataHandler)
+
+        with open(store.get_path(DataHandler)) as spec_file:
+            content = json.load(spec_file)
+
+        content['spec']['root']['children'] = []
+
+        with open(store.get_path(DataHandler), 'w') as spec_file:
+            json.dump(content, spec_file)
+
+        assert not store.load(DataHandler)
+
+    def test_store_of_changed_handler(self, tmp_path):
+        store = SchemaStore(str(tmp_path))
+        store.save(DataHandler)
+
+        with open(store.get_path(DataHandler)) as spec_file:
+            content = json.load(spec_file)
+
+        content['fingerprint'] = 'previous define'
+
+        with open(store.get_path(DataHandler), 'w') as spec_file:
+            json.dump(content, spec_file)
+
+        assert not store.load(DataHandler)
+
+    def test_store_only_imports_allowed_modules(self, tmp_path):
+        store = SchemaStore(str(tmp_path))
+        store.save(DataHandler)
+
+        with open(store.get_path(DataHandler)) as spec_file:
+            content = json.load(spec_file)
+
+        content['spec']['root']['children'][1]['items']['class'] = 'this:Telephone'
+        content['hash'] = get_spec_hash(content['spec'])
+
+        with open(store.get_path(DataHandler), 'w') as spec_file:
+            json.dump(content, spec_file)
+
+        assert not store.load(DataHandler)
+        assert 'this' not in sys.modules
+
+        with pytest.raises(SchemaSpecException):
+            Schema.from_spec(content['spec'], modules=[__name__])
+
+    def test_object_class_must_be_a_class(self):
+        spec = DataHandler().get_schema().to_spec()
+        spec['root']['children'][1]['items']['class'] = __name__ + ':as_dict'
+
+        with pytest.raises(SchemaSpecException):
+            Schema.from_spec(spec, modules=[__name__])
@@ -0,0 +1,94 @@
+import io
+import json
+import pytest
+from fractal_input import InputHandler, ListNode
+from fractal_input import stream
+
+
+class Telephone(object):
+    number = None
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('name', 'string')
+        self.add('meta', 'dict', {'required': False})
+        self.add('telephones', ListNode(Telephone), {'required': False}).add('number', 'string')
+
+
+RECORDS = [
+    {'name': 'Rick', 'unknown': {'deep': [1, 2, {'a': 'b'}]}, 'meta': {'any': [1]}},
+    {'name': 'Morty', 'telephones': [{'number': 1, 'extra': [1, 2]}]},
+    {'unknown': 1},
+    {'name': 'Jerry ☃'},
+]
+
+
+@pytest.fixture(params=['ijson', 'json'])
+def parser(request, monkeypatch):
+    if request.param == 'ijson':
+        pytest.importorskip('ijson')
+    else:
+        monkeypatch.setattr(stream, 'ijson', None)
+
+    return request.param
+
+
+class TestStream(object):
+    def test_iter_bind_json_sync(self, parser):
+        source = io.BytesIO(json.dumps(RECORDS, ensure_ascii=False).encode('utf-8'))
+        results = list(DataHandler().iter_bind_json_sync(source))
+
+        assert [
+            ({'name': 'Rick', 'meta': {'any': [1]}}, []),
+            ({'name': 'Morty', 'telephones': results[1][0]['telephones']}, []),
+            (None, ['name is required']),
+            ({'name': 'Jerry ☃'}, []),
+        ] == results
+        assert '1' == results[1][0]['telephones'][0].number
+
+    def test_small_chunks(self, monkeypatch):
+        monkeypatch.setattr(stream, 'ijson', None)
+
+        data = json.dumps([1, 'a', 23456, {'b': [None, True]}, 'ü' * 10, 1.5e10], ensure_ascii=False).encode('utf-8')
+        reader = stream.get_reader(io.BytesIO(data))
+
+        assert json.loads(data) == list(stream.iter_array_items(reader, chunk_size=3))
+
+    def test_empty_and_invalid_arrays(self, monkeypatch):
+        monkeypatch.setattr(stream, 'ijson', None)
+
+        assert [] == list(stream.iter_json_items(b' [ ] '))
+
+        with pytest.raises(ValueError):
+            list(stream.iter_json_items(b'{"a": 1}'))
+
+        with pytest.raises(ValueError):
+            list(stream.iter_json_items(b'[1, 2'))
+
+    def test_prefix(self, parser):
+        source = json.dumps({'records': RECORDS[:2]})
+        results = list(DataHandler().iter_bind_json_sync(source, prefix='records'))
+
+        assert ['Rick', 'Morty'] == [output['name'] for output, errors in results]
+
+    @pytest.mark.asyncio
+    async def test_bind_json(self, parser):
+        handler = DataHandler()
+        await handler.bind_json(json.dumps(RECORDS[0]))
+
+        assert {'name': 'Rick', 'meta': {'any': [1]}} == handler.get_data()
+
+        outputs = []
+
+        async for output, errors in handler.iter_bind_json(json.dumps(RECORDS).encode('utf-8')):
+            outputs.append(output)
+
+        assert 4 == len(outputs)
+
+    def test_unknown_keys_are_not_built(self):
+        pytest.importorskip('ijson')
+
+        root = DataHandler().get_schema().root_node
+
+        assert {'name': 'Rick', 'meta': {'any': [1]}} == stream.load_json(json.dumps(RECORDS[0]), root)
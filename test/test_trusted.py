@@ -0,0 +1,84 @@
+import pytest
+from fractal_input import InputHandler, ListNode
+from .nodes import EchoNode
+
+
+class Telephone(object):
+    number = None
+
+
+class DataHandler(InputHandler):
+    def define(self):
+        self.add('name', 'string')
+        self.add('role', 'string', {'required': False})
+        address = self.add('address', 'dict')
+        address.add('street', 'string')
+        address.add('number', 'integer')
+        self.add('tags', ListNode('string'), {'required': False})
+        self.add('telephones', ListNode(Telephone), {'required': False}).add('number', 'string')
+
+
+class TestTrusted(object):
+    def test_defaults_do_not_mutate_input(self):
+        payload = {'name': 'Rick', 'address': {'street': 'Lala', 'number': 1}}
+
+        handler = DataHandler()
+        handler.bind_sync(payload, defaults={'role': 'admin'})
+
+        assert 'admin' == handler.get_data()['role']
+        assert {'name': 'Rick', 'address': {'street': 'Lala', 'number': 1}} == payload
+
+    @pytest.mark.asyncio
+    async def test_async_walk(self):
+        class AsyncHandler(InputHandler):
+            def define(self):
+                self.add('name', EchoNode())
+                self.add('role', EchoNode(), {'required': False})
+                self.add('tags', ListNode(EchoNode()))
+
+        payload = {'name': 'Rick', 'tags': ['a']}
+
+        handler = AsyncHandler()
+        await handler.bind(payload, defaults={'role': 'admin'})
+
+        assert {'name': 'Rick', 'role': 'admin', 'tags': ['a']} == handler.get_data()
+        assert 'role' not in payload
+
+        await handler.bind(payload, trusted=True)
+
+        assert payload is handler.get_data()
+        assert payload['tags'] is handler.get_data()['tags']
+
+    def test_output_is_rebuilt_by_default(self):
+        payload = {'name': 'Rick', 'address': {'street': 'Lala', 'number': 1}, 'tags': ['a']}
+
+        handler = DataHandler()
+        handler.bind_sync(payload)
+
+        assert payload == handler.get_data()
+        assert payload['address'] is not handler.get_data()['address']
+        assert payload['tags'] is not handler.get_data()['tags']
+
+    @pytest.mark.asyncio
+    async def test_trusted_input_is_reused(self):
+        payload = {'name': 'Rick', 'address': {'street': 'Lala', 'number': 1}, 'tags': ['a']}
+
+        handler = DataHandler()
+        handler.bind_sync(payload, trusted=True)
+
+        assert payload is handler.get_data()
+        assert payload['address'] is handler.get_data()['address']
+        assert payload['tags'] is handler.get_data()['tags']
+
+        await handler.bind(payload, trusted=True)
+
+        assert payload is handler.get_data()
+
+    def test_trusted_input_is_rebuilt_when_coerced(self):
+        payload = {'name': 'Rick', 'address': {'street': 'Lala', 'number': '1'}, 'extra': 1, 'tags': [1]}
+
+        handler = DataHandler()
+        handler.bind_sync(payload, trusted=True)
+
+        assert {'name': 'Rick', 'address': {'street': 'Lala', 'number': 1}, 'tags': ['1']} == handler.get_data()
+        assert {'street': 'Lala', 'number': '1'} == payload['address']
@@ -0,0 +1,123 @@
+import pytest
+from fractal_input import InputHandler, ListNode, Schema, UnionNode
+from .nodes import EchoNode
+
+
+class Click(object):
+    type = None
+    x = None
+    y = None
+
+
+class KeyPress(object):
+    type = None
+    key = None
+
+
+class EventHandler(InputHandler):
+    def define(self):
+        event = self.add('event', 'union', {'discriminator': 'type'})
+        click = event.add('click', Click)
+        click.add('type', 'string')
+        click.add('x', 'integer')
+        click.add('y', 'integer')
+        key_press = event.add('key', KeyPress)
+        key_press.add('type', 'string')
+        key_press.add('key', 'string')
+
+
+class ShapeHandler(InputHandler):
+    def define(self):
+        shapes = self.add('shapes', ListNode(UnionNode()))
+        circle = shapes.add('circle', 'dict')
+        circle.add('radius', 'float')
+        square = shapes.add('square', 'dict')
+        square.add('side', 'float')
+
+
+class TestUnionNode(object):
+    def test_discriminator(self):
+        handler = EventHandler()
+        handler.bind_sync({'event': {'type': 'click', 'x': '1', 'y': 2}})
+
+        event = handler.get_data()['event']
+
+        assert isinstance(event, Click)
+        assert ('click', 1, 2) == (event.type, event.x, event.y)
+
+        handler.bind_sync({'event': {'type': 'key', 'key': 'a'}})
+
+        assert isinstance(handler.get_data()['event'], KeyPress)
+
+    def test_discriminator_errors(self):
+        handler = EventHandler()
+
+        handler.bind_sync({'event': {'type': 'scroll'}})
+        assert ['Invalid event: unknown type scroll'] == handler.errors
+
+        handler.bind_sync({'event': {'type': 'click', 'x': 1}})
+        assert [{'path': '/event/y', 'message': 'y is required'}] == handler.get_errors()
+
+        handler.bind_sync({'event': 'click'})
+        assert ['Invalid event: click is not an object'] == handler.errors
+
+        handler.bind_sync({})
+        assert ['event is required'] == handler.errors
+
+    def test_try_each(self):
+        handler = ShapeHandler()
+        handler.bind_sync({'shapes': [{'side': '2'}, {'radius': 1}, {'side': 3}, {'side': 4}]}, collect_errors=True)
+
+        assert handler.is_valid()
+        assert [{'side': 2.0}, {'radius': 1.0}, {'side': 3.0}, {'side': 4.0}] == handler.get_data()['shapes']
+
+        union = handler.get_schema().root_node.children[0].get_inner_node()
+
+        assert {'square': 3, 'circle': 1} == union.matches
+        assert ['square', 'circle'] == [candidate.name for candidate in union.candidates]
+
+        handler.bind_sync({'shapes': [{'sides': 3}]})
+
+        assert ['Invalid root: value does not match any variant'] == handler.errors
+
+    def test_order_follows_recent_matches(self):
+        class RecentShapeHandler(ShapeHandler):
+            pass
+
+        handler = RecentShapeHandler()
+        union = handler.get_schema().root_node.children[0].get_inner_node()
+        union.match_window = 8
+
+        handler.bind_sync({'shapes': [{'side': 1}] * 100})
+
+        assert ['square', 'circle'] == [candidate.name for candidate in union.candidates]
+
+        handler.bind_sync({'shapes': [{'radius': 1}] * 10})
+
+        assert ['circle', 'square'] == [candidate.name for candidate in union.candidates]
+
+    @pytest.mark.asyncio
+    async def test_async_variants(self):
+        class AsyncHandler(InputHandler):
+            def define(self):
+                event = self.add('event', 'union', {'discriminator': 'type'})
+                event.add('click', 'dict').add('type', EchoNode())
+                shape = self.add('shape', 'union')
+                shape.add('circle', 'dict').add('radius', EchoNode())
+                shape.add('square', 'dict').add('side', EchoNode())
+
+        handler = AsyncHandler()
+        await handler.bind({'event': {'type': 'click'}, 'shape': {'side': 'a'}})
+
+        assert {'event': {'type': 'click'}, 'shape': {'side': 'a'}} == handler.get_data()
+
+        await handler.bind({'event': {'type': 'other'}, 'shape': {'side': 'a'}})
+
+        assert ['Invalid event: unknown type other'] == handler.errors
+
+    def test_spec(self):
+        schema = Schema.from_spec(EventHandler().get_schema().to_spec())
+        output, errors = schema.validate_sync({'event': {'type': 'key', 'key': 'a'}})
+
+        assert isinstance(output['event'], KeyPress)
+        assert [] == errors
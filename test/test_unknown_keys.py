@@ -0,0 +1,122 @@
+import pytest
+from fractal_input import DatetimeNode, InputHandler, ListNode, Schema
+from .nodes import EchoNode
+
+
+class Address(object):
+    street = None
+
+
+class DataHandler(InputHandler):
+    unknown = 'reject'
+
+    def define(self):
+        self.add('name', 'string')
+        self.add('meta', 'dict', {'required': False, 'unknown': 'keep'}).add('source', 'string')
+        self.add('address', Address, {'required': False}).add('street', 'string')
+        self.add('items', ListNode('dict'), {'required': False, 'unknown': 'ignore'}).add('id', 'integer')
+
+
+class TestUnknownKeys(object):
+    def test_reject(self):
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'role': 'admin', 'age': 1}, collect_errors=True)
+
+        assert [
+            {'path': '/age', 'message': 'age is not allowed'},
+            {'path': '/role', 'message': 'role is not allowed'},
+        ] == handler.get_errors()
+
+        handler.bind_sync({'role': 'admin'}, collect_errors=True)
+
+        assert ['name is required', 'role is not allowed'] == handler.errors
+
+    def test_keep(self):
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'meta': {'source': 1, 'x': [1], 'y': None}})
+
+        assert handler.is_valid()
+        assert {'source': '1', 'x': [1], 'y': None} == handler.get_data()['meta']
+
+    def test_keep_trusted(self):
+        meta = {'source': 'web', 'x': 1}
+
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'meta': meta}, trusted=True)
+
+        assert handler.get_data()['meta'] is meta
+
+    def test_ignore(self):
+        handler = DataHandler()
+        handler.bind_sync({'name': 'Rick', 'address': {'street': 'Lala', 'number': 1}, 'items': [{'id': 1, 'x': 2}]})
+
+        assert handler.is_valid()
+        assert [{'id': 1}] == handler.get_data()['items']
+        assert not hasattr(handler.get_data()['address'], 'number')
+
+    def test_invalid_policy(self):
+        class InvalidHandler(InputHandler):
+            def define(self):
+                self.add('meta', 'dict', {'unknown': 'drop'})
+
+        with pytest.raises(ValueError):
+            InvalidHandler().get_schema()
+
+        class ObjectHandler(InputHandler):
+            def define(self):
+                self.add('address', Address, {'unknown': 'keep'})
+
+        with pytest.raises(ValueError):
+            ObjectHandler().get_schema()
+
+    def test_list_items(self):
+        class ListHandler(InputHandler):
+            def define(self):
+                self.add('items', ListNode('dict'), {'unknown': 'reject'}).add('id', 'integer')
+                self.add('addresses', ListNode(Address), {'required': False, 'unknown': 'reject'}).add('street', 'string')
+
+        handler = ListHandler()
+        handler.bind_sync({'items': [{'id': 1, 'evil': 2}], 'addresses': [{'street': 'Lala', 'evil': 2}]}, collect_errors=True)
+
+        assert [
+            {'path': '/items/0/evil', 'message': 'evil is not allowed'},
+            {'path': '/addresses/0/evil', 'message': 'evil is not allowed'},
+        ] == handler.get_errors()
+
+        schema = Schema.from_spec(handler.get_schema().to_spec())
+        output, errors = schema.validate_sync({'items': [{'id': 1, 'evil': 2}]})
+
+        assert ['evil is not allowed'] == [error.message for error in errors]
+
+    def test_nodes_without_fields(self):
+        for node_type in ['string', ListNode('integer'), DatetimeNode(), 'union']:
+            class ScalarHandler(InputHandler):
+                def define(self):
+                    self.add('value', node_type, {'unknown': 'reject'})
+
+            with pytest.raises(ValueError):
+                ScalarHandler().get_schema()
+
+    @pytest.mark.asyncio
+    async def test_async_walk(self):
+        class AsyncHandler(InputHandler):
+            unknown = 'reject'
+
+            def define(self):
+                self.add('name', EchoNode())
+                self.add('meta', 'dict', {'required': False, 'unknown': 'keep'}).add('source', EchoNode())
+
+        handler = AsyncHandler()
+        await handler.bind({'name': 'Rick', 'meta': {'source': 'web', 'x': 1}})
+
+        assert {'name': 'Rick', 'meta': {'source': 'web', 'x': 1}} == handler.get_data()
+
+        await handler.bind({'role': 'admin'}, collect_errors=True)
+
+        assert ['name is required', 'role is not allowed'] == handler.errors
+
+    def test_spec(self):
+        schema = Schema.from_spec(DataHandler().get_schema().to_spec())
+        output, errors = schema.validate_sync({'name': 'Rick', 'role': 'admin'})
+
+        assert ['role is not allowed'] == [error.message for error in errors]